@@ -22,6 +22,7 @@ import pytest
 from benchmarks.sample_code import (
     GO_CODE,
     JAVASCRIPT_CODE,
+    JSON_LOG_2K,
     PYTHON_10K,
     PYTHON_LARGE,
     PYTHON_MEDIUM,
@@ -159,6 +160,13 @@ class TestRosettesPerformance:
         result = benchmark(lambda: highlight(GO_CODE, "go"))
         assert "rosettes" in result
 
+    def test_rosettes_json_stream(self, benchmark) -> None:
+        """Benchmark Rosettes on a large JSON log stream (~14k lines)."""
+        from rosettes import highlight
+
+        result = benchmark(lambda: highlight(JSON_LOG_2K, "json"))
+        assert "rosettes" in result
+
 
 @pytest.mark.skipif(not _pygments_available(), reason="Pygments not installed")
 class TestPygmentsPerformance:
@@ -219,6 +219,38 @@ func main() {
 }
 '''
 
+# -----------------------------------------------------------------------------
+# JSON sample (log-ingest style: the workload with the largest token streams)
+# -----------------------------------------------------------------------------
+
+
+def generate_json_records(records: int) -> str:
+    """Generate a synthetic JSON telemetry stream for benchmarking.
+
+    Args:
+        records: Number of log records to generate.
+
+    Returns:
+        Generated JSON document (an array of record objects).
+    """
+    parts = ["["]
+    for i in range(records):
+        parts.append("  {")
+        parts.append(f'    "timestamp": {1700000000 + i},')
+        parts.append(f'    "level": "{"info" if i % 7 else "error"}",')
+        parts.append(f'    "request_id": "req-{i:08x}",')
+        parts.append(f'    "duration_ms": {(i * 37) % 1000}.{i % 100:02d},')
+        parts.append(f'    "cached": {"true" if i % 3 else "false"},')
+        parts.append(f'    "trace": {"null" if i % 5 else "[1, 2, 3]"}')
+        parts.append("  }," if i < records - 1 else "  }")
+    parts.append("]")
+    return "\n".join(parts)
+
+
+# Pre-generated large sample (~14k lines, ~500KB)
+JSON_LOG_2K = generate_json_records(2_000)
+
+
 # -----------------------------------------------------------------------------
 # Scaled samples
 # -----------------------------------------------------------------------------
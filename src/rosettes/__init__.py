@@ -114,7 +114,7 @@ from rosettes._registry import (
     supports_language,
 )
 from rosettes._types import Token, TokenType
-from rosettes.formatters import HtmlFormatter
+from rosettes.formatters import HtmlFormatter, NullFormatter
 
 if TYPE_CHECKING:
     from collections.abc import Iterable
@@ -208,6 +208,11 @@ def highlight(
     # Resolve formatter
     formatter_inst = get_formatter(formatter) if isinstance(formatter, str) else formatter
 
+    # Null formatter: tokenization is lossless and the formatter adds
+    # nothing, so the output is the input slice — skip the lex pass
+    if type(formatter_inst) is NullFormatter:
+        return code[start:end] if start or end is not None else code
+
     # Determine container class based on style
     if css_class is None:
         css_class = "rosettes" if css_class_style == "semantic" else "highlight"
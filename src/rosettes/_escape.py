@@ -73,4 +73,10 @@ def escape_html(text: str) -> str:
         >>> escape_html("def foo():")  # No escaping needed
         'def foo():'
     """
-    return text.translate(_ESCAPE_TABLE)
+    # Most tokens (identifiers, keywords, whitespace) contain none of
+    # the five specials: five C-level membership scans are cheaper than
+    # the per-character table walk, and the clean case returns the
+    # input string unchanged with no allocation.
+    if "&" in text or "<" in text or ">" in text or '"' in text or "'" in text:
+        return text.translate(_ESCAPE_TABLE)
+    return text
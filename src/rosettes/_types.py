@@ -196,6 +196,15 @@ class Token(NamedTuple):
     Fast Path:
         When position info is not needed, use tokenize_fast() which yields
         (TokenType, str) tuples instead of Token objects for ~20% speedup.
+
+    Design Decision — eager value slicing:
+        Tokens store their text eagerly rather than as (source, start, end)
+        with a lazy slicing property. Lazy slicing would keep the entire
+        source string alive through every retained token (a leak for
+        long-lived token streams) and every shipped consumer reads .value
+        anyway, so the slice is not avoidable work. NamedTuple also keeps
+        tuple semantics (equality, unpacking, indexing) that are part of
+        the public API.
     """
 
     type: TokenType
@@ -67,6 +67,7 @@ from __future__ import annotations
 
 from collections.abc import Iterator
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Literal
 
 from rosettes._config import FormatConfig, HighlightConfig
@@ -85,6 +86,12 @@ CssClassStyle = Literal["semantic", "pygments"]
 # Pre-compute token types that don't need spans
 _NO_SPAN_TYPES = frozenset({TokenType.TEXT, TokenType.WHITESPACE})
 
+# Cap on the hl_lines byte-mask size. The mask is sized by the largest
+# requested line number, which the caller controls — without a cap,
+# hl_lines={10**9} on a one-line input would allocate a gigabyte.
+# Lines past the cap fall back to a set probe.
+_HL_MASK_MAX_LINE = 1 << 16
+
 # Semantic class names for roles
 _SEMANTIC_CLASS: dict[SyntaxRole, str] = {
     SyntaxRole.CONTROL_FLOW: "syntax-control",
@@ -114,18 +121,60 @@ _SEMANTIC_CLASS: dict[SyntaxRole, str] = {
     SyntaxRole.ESCAPE: "syntax-escape",
 }
 
-# Pre-build span templates for Pygments compatibility
-_SPAN_OPEN: dict[str, str] = {}
+# Pre-build span templates for Pygments compatibility, keyed by
+# TokenType so the hot loop skips the .value attribute load (StrEnum
+# members hash as their string value anyway)
+_SPAN_OPEN: dict[TokenType, str] = {}
 _SPAN_CLOSE = "</span>"
 for _tt in TokenType:
     if _tt not in _NO_SPAN_TYPES:
-        _SPAN_OPEN[_tt.value] = f'<span class="{_tt.value}">'
-
-# Pre-build semantic span templates
-_SEMANTIC_SPAN_OPEN: dict[SyntaxRole, str] = {}
-for _role, _class_name in _SEMANTIC_CLASS.items():
+        _SPAN_OPEN[_tt] = f'<span class="{_tt.value}">'
+
+# Pre-build semantic span templates, keyed directly by TokenType.
+# Folding ROLE_MAPPING into the table at import removes the per-token
+# role resolution (two dict probes with StrEnum hashing) from the hot
+# loops — the role enum stays the public theming API, but formatting
+# never touches it per token.
+_SEMANTIC_TOKEN_CLASS: dict[TokenType, str] = {}
+_SEMANTIC_SPAN_OPEN: dict[TokenType, str] = {}
+for _tt in TokenType:
+    _class_name = _SEMANTIC_CLASS.get(ROLE_MAPPING.get(_tt, SyntaxRole.TEXT), "")
     if _class_name:
-        _SEMANTIC_SPAN_OPEN[_role] = f'<span class="{_class_name}">'
+        _SEMANTIC_TOKEN_CLASS[_tt] = _class_name
+        _SEMANTIC_SPAN_OPEN[_tt] = f'<span class="{_class_name}">'
+
+
+@lru_cache(maxsize=128)
+def _wrapper_open(container: str, data_language: str) -> str:
+    """Build (and cache) the opening wrapper markup.
+
+    Repeated highlight calls reuse a handful of (container, language)
+    pairs, so the f-string assembly runs once per pair.
+    """
+    data_lang_attr = f' data-language="{data_language}"' if data_language else ""
+    return f'<div class="{container}"{data_lang_attr}><pre><code>'
+
+
+def _coalesce(tokens: Iterator[tuple[TokenType, str]]) -> Iterator[tuple[TokenType, str]]:
+    """Fuse runs of identical token types into single pairs.
+
+    Adjacent tokens of the same type render identically, so merging
+    them before emission means one span pair and one escape call per
+    run instead of per token. Rendered output is equivalent — same
+    text, same classes, fewer spans.
+    """
+    buf_type: TokenType | None = None
+    buf_vals: list[str] = []
+    for token_type, value in tokens:
+        if token_type is buf_type:
+            buf_vals.append(value)
+        else:
+            if buf_type is not None:
+                yield buf_type, buf_vals[0] if len(buf_vals) == 1 else "".join(buf_vals)
+            buf_type = token_type
+            buf_vals = [value]
+    if buf_type is not None:
+        yield buf_type, buf_vals[0] if len(buf_vals) == 1 else "".join(buf_vals)
 
 
 @dataclass(frozen=True, slots=True)
@@ -204,27 +253,27 @@ class HtmlFormatter:
 
         span_close = _SPAN_CLOSE
 
+        # Merge same-type runs up front: fewer spans, fewer escapes
+        tokens = _coalesce(tokens)
+
         # Opening tags
         if config.wrap_code:
-            data_lang_attr = (
-                f' data-language="{config.data_language}"' if config.data_language else ""
-            )
-            yield f'<div class="{container}"{data_lang_attr}><pre><code>'
+            yield _wrapper_open(container, config.data_language)
 
         # Hot path - format each token
         if is_semantic:
-            semantic_span_open: dict[SyntaxRole, str] = _SEMANTIC_SPAN_OPEN
+            semantic_span_open: dict[TokenType, str] = _SEMANTIC_SPAN_OPEN
             if prefix:
                 semantic_span_open = {
-                    k: f'<span class="{prefix}{v.split(">")[0].split(chr(34))[1]}">'
-                    for k, v in semantic_span_open.items()
+                    k: f'<span class="{prefix}{_SEMANTIC_TOKEN_CLASS[k]}">'
+                    for k in semantic_span_open
                 }
+            get_open = semantic_span_open.get
             for token_type, value in tokens:
                 if token_type in no_span:
                     yield escape(value)
                 else:
-                    role = ROLE_MAPPING.get(token_type, SyntaxRole.TEXT)
-                    template = semantic_span_open.get(role)
+                    template = get_open(token_type)
                     if template:
                         yield template
                         yield escape(value)
@@ -232,15 +281,17 @@ class HtmlFormatter:
                     else:
                         yield escape(value)
         else:
-            pygments_span_open: dict[str, str] = _SPAN_OPEN
+            pygments_span_open: dict[TokenType, str] = _SPAN_OPEN
             if prefix:
-                pygments_span_open = {k: f'<span class="{prefix}{k}">' for k in pygments_span_open}
+                pygments_span_open = {
+                    k: f'<span class="{prefix}{k.value}">' for k in pygments_span_open
+                }
+            get_open = pygments_span_open.get
             for token_type, value in tokens:
                 if token_type in no_span:
                     yield escape(value)
                 else:
-                    tv = token_type.value
-                    template = pygments_span_open.get(tv)
+                    template = get_open(token_type)
                     if template:
                         yield template
                         yield escape(value)
@@ -279,25 +330,41 @@ class HtmlFormatter:
         hl_span_open = f'<span class="{hl_line_class}">'
         span_close = _SPAN_CLOSE
 
+        # Highlighted lines as a byte mask: one bounds check + byte load
+        # per line transition instead of a set probe (hl_lines is small,
+        # so the mask stays L1-resident). The mask is capped at
+        # _HL_MASK_MAX_LINE so a hostile line number can't drive the
+        # allocation; entries past the cap keep the set-probe path and
+        # non-positive entries (which can never match a 1-based line)
+        # are dropped.
+        mask_len = min(max(max(hl_lines), 0), _HL_MASK_MAX_LINE) + 1
+        hl_mask = bytearray(mask_len)
+        overflow = []
+        for ln in hl_lines:
+            if 0 < ln < mask_len:
+                hl_mask[ln] = 1
+            elif ln >= mask_len:
+                overflow.append(ln)
+        hl_overflow = frozenset(overflow)
+
         # Prepare span lookup tables
-        semantic_span_open: dict[SyntaxRole, str] | None = None
-        pygments_span_open: dict[str, str] | None = None
+        semantic_span_open: dict[TokenType, str] | None = None
+        pygments_span_open: dict[TokenType, str] | None = None
 
         if is_semantic:
             semantic_span_open = _SEMANTIC_SPAN_OPEN
         else:
             pygments_span_open = _SPAN_OPEN
             if prefix:
-                pygments_span_open = {k: f'<span class="{prefix}{k}">' for k in pygments_span_open}
+                pygments_span_open = {
+                    k: f'<span class="{prefix}{k.value}">' for k in pygments_span_open
+                }
 
         if config.wrap_code:
-            data_lang_attr = (
-                f' data-language="{config.data_language}"' if config.data_language else ""
-            )
-            yield f'<div class="{container}"{data_lang_attr}><pre><code>'
+            yield _wrapper_open(container, config.data_language)
 
         current_line = 1
-        in_hl = current_line in hl_lines
+        in_hl = hl_mask[current_line] if current_line < mask_len else current_line in hl_overflow
 
         if in_hl:
             yield hl_span_open
@@ -309,7 +376,11 @@ class HtmlFormatter:
                     yield span_close
                 yield "\n"
                 current_line += 1
-                in_hl = current_line in hl_lines
+                in_hl = (
+                    hl_mask[current_line]
+                    if current_line < mask_len
+                    else current_line in hl_overflow
+                )
                 if in_hl:
                     yield hl_span_open
 
@@ -319,10 +390,9 @@ class HtmlFormatter:
                 yield escaped
             else:
                 if is_semantic and semantic_span_open is not None:
-                    role = ROLE_MAPPING.get(token.type, SyntaxRole.TEXT)
-                    template = semantic_span_open.get(role)
+                    template = semantic_span_open.get(token.type)
                 elif pygments_span_open is not None:
-                    template = pygments_span_open.get(token.type.value)
+                    template = pygments_span_open.get(token.type)
                 else:
                     template = None
 
@@ -341,9 +411,12 @@ class HtmlFormatter:
                     yield span_close
                 # Count newlines without second scan
                 newlines = value.count("\n", nl_idx)
-                for _ in range(newlines):
-                    current_line += 1
-                    in_hl = current_line in hl_lines
+                current_line += newlines
+                in_hl = (
+                    hl_mask[current_line]
+                    if current_line < mask_len
+                    else current_line in hl_overflow
+                )
                 if in_hl:
                     yield hl_span_open
 
@@ -365,4 +438,55 @@ class HtmlFormatter:
         tokens: Iterator[tuple[TokenType, str]],
         config: FormatConfig | None = None,
     ) -> str:
-        return "".join(self.format_fast(tokens, config))
+        """Format to a single string without the streaming layer.
+
+        Same output as joining format_fast(), but the emission loop
+        runs inline with C-level list appends — no generator frame
+        switch per chunk. This is the hottest whole-string path.
+        """
+        if config is None:
+            config = FormatConfig()
+
+        is_semantic = self.css_class_style == "semantic"
+
+        # Cache lookups
+        no_span = _NO_SPAN_TYPES
+        escape = escape_html
+        prefix = config.class_prefix
+        container = config.css_class if config.css_class else self.container_class
+        span_close = _SPAN_CLOSE
+
+        if is_semantic:
+            span_open: dict[TokenType, str] = _SEMANTIC_SPAN_OPEN
+            if prefix:
+                span_open = {
+                    k: f'<span class="{prefix}{_SEMANTIC_TOKEN_CLASS[k]}">' for k in span_open
+                }
+        else:
+            span_open = _SPAN_OPEN
+            if prefix:
+                span_open = {k: f'<span class="{prefix}{k.value}">' for k in span_open}
+        get_open = span_open.get
+
+        out: list[str] = []
+        append = out.append
+
+        if config.wrap_code:
+            append(_wrapper_open(container, config.data_language))
+
+        for token_type, value in _coalesce(tokens):
+            if token_type in no_span:
+                append(escape(value))
+            else:
+                template = get_open(token_type)
+                if template:
+                    append(template)
+                    append(escape(value))
+                    append(span_close)
+                else:
+                    append(escape(value))
+
+        if config.wrap_code:
+            append("</code></pre></div>")
+
+        return "".join(out)
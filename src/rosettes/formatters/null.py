@@ -105,8 +105,13 @@ class NullFormatter:
         tokens: Iterator[Token],
         config: FormatConfig | None = None,
     ) -> str:
-        """Format tokens and return as a single string."""
-        return "".join(self.format(tokens, config))
+        """Format tokens and return as a single string.
+
+        Joins directly over the token stream — routing through the
+        format() generator would add a second generator frame per token
+        for no benefit.
+        """
+        return "".join(token.value for token in tokens)
 
     def format_string_fast(
         self,
@@ -114,4 +119,4 @@ class NullFormatter:
         config: FormatConfig | None = None,
     ) -> str:
         """Fast format and return as a single string."""
-        return "".join(self.format_fast(tokens, config))
+        return "".join(value for _, value in tokens)
@@ -142,7 +142,7 @@ class TerminalFormatter:
         config: FormatConfig | None = None,
     ) -> Iterator[str]:
         """Fast ANSI formatting using pre-computed color maps."""
-        ansi_start = _TOKEN_ANSI_START
+        get_color = _TOKEN_ANSI_START.get
         no_color = _NO_COLOR_TYPES
         reset = _RESET
 
@@ -150,7 +150,7 @@ class TerminalFormatter:
             if tt in no_color:
                 yield value
             else:
-                color = ansi_start.get(tt)
+                color = get_color(tt)
                 if color:
                     yield color
                     yield value
@@ -164,7 +164,7 @@ class TerminalFormatter:
         config: FormatConfig | None = None,
     ) -> Iterator[str]:
         """Format tokens as ANSI-colored strings."""
-        ansi_start = _TOKEN_ANSI_START
+        get_color = _TOKEN_ANSI_START.get
         no_color = _NO_COLOR_TYPES
         reset = _RESET
 
@@ -173,7 +173,7 @@ class TerminalFormatter:
             if tt in no_color:
                 yield token.value
             else:
-                color = ansi_start.get(tt)
+                color = get_color(tt)
                 if color:
                     yield color
                     yield token.value
@@ -70,10 +70,11 @@ local variables. Character sets are defined as module-level frozensets.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from rosettes._types import Token, TokenType
+from rosettes.lexers._tables import IS_IDENT_CONT, IS_IDENT_CONT_DOLLAR
 
 if TYPE_CHECKING:
     pass
@@ -125,6 +126,24 @@ class NumberConfig:
     float_suffixes: tuple[str, ...] = ()
     imaginary_suffix: str | None = None
 
+    def __post_init__(self) -> None:
+        """Normalize suffixes longest-first once, at construction.
+
+        Suffix matching is longest-first; sorting here means the number
+        scanner never re-sorts per literal. Configs are built once per
+        lexer class, so this is paid at import time.
+        """
+        object.__setattr__(
+            self,
+            "integer_suffixes",
+            tuple(sorted(self.integer_suffixes, key=len, reverse=True)),
+        )
+        object.__setattr__(
+            self,
+            "float_suffixes",
+            tuple(sorted(self.float_suffixes, key=len, reverse=True)),
+        )
+
 
 @dataclass(frozen=True, slots=True)
 class StringConfig:
@@ -173,11 +192,30 @@ class OperatorConfig:
     """Configuration for operator scanning.
 
     Operators are scanned longest-first. Group by length for efficiency.
+
+    ``by_first`` is derived at construction: it maps each leading
+    character to its multi-char candidates, longest-first, so the
+    scanner only compares the handful of operators that can actually
+    start at the current character.
     """
 
     three_char: frozenset[str] = frozenset()
     two_char: frozenset[str] = frozenset()
     one_char: frozenset[str] = frozenset()
+    by_first: dict[str, tuple[str, ...]] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the first-char candidate table."""
+        grouped: dict[str, list[str]] = {}
+        for op in self.three_char:
+            grouped.setdefault(op[0], []).append(op)
+        for op in self.two_char:
+            grouped.setdefault(op[0], []).append(op)
+        object.__setattr__(
+            self,
+            "by_first",
+            {char: tuple(sorted(ops, key=len, reverse=True)) for char, ops in grouped.items()},
+        )
 
 
 # =============================================================================
@@ -270,10 +308,12 @@ def scan_identifier(
         Position after identifier.
     """
     length = len(code)
-    cont_chars = IDENT_CONT_DOLLAR if allow_dollar else IDENT_CONT
+    # Byte-table classification: one C-level bytes index per char
+    # instead of a frozenset hash probe (identifiers are ASCII-only)
+    cont_chars = IS_IDENT_CONT_DOLLAR if allow_dollar else IS_IDENT_CONT
 
     pos += 1  # Skip first character (already validated)
-    while pos < length and code[pos] in cont_chars:
+    while pos < length and (b := ord(code[pos])) < 256 and cont_chars[b]:
         pos += 1
 
     return pos
@@ -501,13 +541,12 @@ def _scan_exponent(code: str, pos: int, allow_underscores: bool) -> int:
 
 
 def _scan_suffix(code: str, pos: int, suffixes: tuple[str, ...]) -> int:
-    """Scan optional type suffix (e.g., u32, f64, n)."""
-    if not suffixes:
-        return pos
+    """Scan optional type suffix (e.g., u32, f64, n).
 
-    # Check suffixes longest-first
-    for suffix in sorted(suffixes, key=len, reverse=True):
-        if code[pos : pos + len(suffix)] == suffix:
+    Suffixes are presorted longest-first by NumberConfig.__post_init__.
+    """
+    for suffix in suffixes:
+        if code.startswith(suffix, pos):
             return pos + len(suffix)
 
     return pos
@@ -523,23 +562,19 @@ def scan_operators(
     Returns:
         Tuple of (operator string or None, new position).
     """
-    # Check 3-char operators first
-    if config.three_char and pos + 2 < len(code):
-        three = code[pos : pos + 3]
-        if three in config.three_char:
-            return three, pos + 3
-
-    # Check 2-char operators
-    if config.two_char and pos + 1 < len(code):
-        two = code[pos : pos + 2]
-        if two in config.two_char:
-            return two, pos + 2
-
-    # Check 1-char operators
-    if config.one_char:
-        one = code[pos]
-        if one in config.one_char:
-            return one, pos + 1
+    char = code[pos]
+
+    # Multi-char operators: only the candidates that share this first
+    # character, longest-first (typically 0-3 strings)
+    candidates = config.by_first.get(char)
+    if candidates:
+        for op in candidates:
+            if code.startswith(op, pos):
+                return op, pos + len(op)
+
+    # Single-char operators
+    if char in config.one_char:
+        return char, pos + 1
 
     return None, pos
 
@@ -35,6 +35,7 @@ Helper functions provide common patterns:
 - `scan_triple_string()`: Handle triple-quoted strings
 - `scan_line_comment()`: Scan to end of line
 - `scan_block_comment()`: Scan to end marker
+- `line_index()` / `position_at()`: Batch line/column lookup by offset
 
 **Adding New Languages:**
 
@@ -77,6 +78,10 @@ Key rules:
 - Use `scan_while`/`scan_until` helpers for common patterns
 - Avoid string slicing in hot loops (use start/end indices)
 - Pre-compute character sets as class attributes
+- Batch newline bookkeeping: `str.count`/`str.rfind` over a scanned
+  region beats per-character `line += 1` tracking; when positions are
+  only needed occasionally, skip tracking entirely (`tokenize_fast`)
+  and recover them on demand with `line_index`/`position_at`
 
 **See Also:**
 
@@ -87,7 +92,10 @@ Key rules:
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_right
 from collections.abc import Iterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from rosettes._config import LexerConfig
@@ -98,13 +106,74 @@ if TYPE_CHECKING:
 
 __all__ = [
     "StateMachineLexer",
+    "TokenColumns",
     "scan_while",
     "scan_until",
     "scan_string",
     "scan_triple_string",
+    "line_index",
+    "position_at",
 ]
 
 
+# Stable TokenType <-> small-int codes for the columnar layout below.
+# Enum definition order is part of the in-process contract only; codes
+# are never serialized.
+_TOKEN_TYPES: tuple[TokenType, ...] = tuple(TokenType)
+_TYPE_CODE: dict[TokenType, int] = {t: i for i, t in enumerate(_TOKEN_TYPES)}
+
+
+@dataclass(slots=True)
+class TokenColumns:
+    """Structure-of-arrays token stream for column-oriented passes.
+
+    Stores one `array.array` per Token field plus (start, end) source
+    offsets instead of a list of Token objects. A pass that only reads
+    token types (stats, type histograms) walks one compact byte array
+    with perfect cache locality and no per-token PyObject overhead;
+    the source string is kept so values can be sliced on demand.
+
+    Produced by `StateMachineLexer.tokenize_soa()`. Iterating yields
+    regular `Token` objects for drop-in compatibility with code written
+    against `tokenize()`.
+
+    Attributes:
+        code: The source string the offsets index into.
+        types: TokenType codes ('B'); decode via `iter` or `token_at`.
+        starts: Token start offsets into `code` ('L').
+        ends: Token end offsets into `code` ('L').
+        lines: 1-based start lines ('L').
+        columns: 1-based start columns ('L').
+    """
+
+    code: str
+    types: array
+    starts: array
+    ends: array
+    lines: array
+    columns: array
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def token_at(self, index: int) -> Token:
+        """Materialize the Token at ``index``."""
+        return Token(
+            _TOKEN_TYPES[self.types[index]],
+            self.code[self.starts[index] : self.ends[index]],
+            self.lines[index],
+            self.columns[index],
+        )
+
+    def __iter__(self) -> Iterator[Token]:
+        code = self.code
+        token_types = _TOKEN_TYPES
+        for type_code, start, end, line, column in zip(
+            self.types, self.starts, self.ends, self.lines, self.columns, strict=True
+        ):
+            yield Token(token_types[type_code], code[start:end], line, column)
+
+
 class StateMachineLexer:
     """Base class for hand-written state machine lexers.
 
@@ -237,6 +306,42 @@ class StateMachineLexer:
         for token in self.tokenize(code, start=start, end=end):
             yield (token.type, token.value)
 
+    def tokenize_soa(
+        self,
+        code: str,
+        start: int = 0,
+        end: int | None = None,
+    ) -> TokenColumns:
+        """Tokenize into a columnar (structure-of-arrays) layout.
+
+        Relies on the lexer invariant that token values concatenate back
+        to the input, so source offsets are recovered from a running
+        length sum rather than re-scanning.
+
+        Args:
+            code: The source code to tokenize.
+            start: Starting index in the source string.
+            end: Optional ending index in the source string.
+
+        Returns:
+            A TokenColumns holding one array per Token field.
+        """
+        types: array = array("B")
+        starts: array = array("L")
+        ends: array = array("L")
+        lines: array = array("L")
+        columns: array = array("L")
+        type_code = _TYPE_CODE
+        pos = start
+        for token in self.tokenize(code, start=start, end=end):
+            types.append(type_code[token.type])
+            starts.append(pos)
+            pos += len(token.value)
+            ends.append(pos)
+            lines.append(token.line)
+            columns.append(token.column)
+        return TokenColumns(code, types, starts, ends, lines, columns)
+
 
 # =============================================================================
 # Helper functions for common scanning patterns
@@ -344,6 +449,48 @@ def scan_triple_string(code: str, pos: int, quote: str) -> int:
     return pos  # End of input (unterminated)
 
 
+def line_index(code: str) -> tuple[int, ...]:
+    """Collect the offsets of all newlines in ``code``.
+
+    One pass of C-level `str.find` calls — far cheaper than tracking
+    line numbers per character. Build the index once per document and
+    share it across any number of `position_at()` lookups.
+
+    Args:
+        code: Source code string.
+
+    Returns:
+        Sorted tuple of indices where '\\n' occurs.
+    """
+    offsets = []
+    append = offsets.append
+    found = code.find("\n")
+    while found != -1:
+        append(found)
+        found = code.find("\n", found + 1)
+    return tuple(offsets)
+
+
+def position_at(nl_offsets: tuple[int, ...], offset: int) -> tuple[int, int]:
+    """Recover the (line, column) of a character offset after the fact.
+
+    Pairs with `line_index()` and `tokenize_fast()`: lexers can skip all
+    per-character line bookkeeping in the hot loop and consumers that
+    need a position (error reporting, jump-to-line) look it up here with
+    one O(log n) bisect instead.
+
+    Args:
+        nl_offsets: Newline offsets from `line_index()`.
+        offset: 0-based character offset into the source.
+
+    Returns:
+        1-based (line, column) of the character at ``offset``.
+    """
+    line = bisect_right(nl_offsets, offset - 1) + 1
+    line_start = nl_offsets[line - 2] + 1 if line > 1 else 0
+    return line, offset - line_start + 1
+
+
 def scan_line_comment(code: str, pos: int) -> int:
     """Scan to end of line (for line comments).
 
@@ -0,0 +1,83 @@
+"""Shared ASCII character-class byte tables for hot scanning loops.
+
+O(1) classification, zero regex, thread-safe.
+
+**Design Philosophy:**
+
+Hot lexer loops classify millions of characters. A 256-entry ``bytes``
+table indexed by ``ord(char)`` answers "is this a digit / identifier
+char / whitespace?" with a single C-level ``PyBytes_GET_ITEM`` — no
+hashing, no Unicode machinery, no per-call allocation. ``bytes`` is
+immutable, so the tables are thread-safe by construction and shared
+freely across lexers.
+
+Convention: entries for bytes >= 128 are 0 in the identifier/name
+tables, so callers that accept non-ASCII letters guard with
+``byte < 128`` and fall back to ``str.isalnum()`` for the rare
+non-ASCII character.
+
+**Usage:**
+
+```python
+from rosettes.lexers._tables import IS_DIGIT
+
+while pos < length and (b := ord(code[pos])) < 256 and IS_DIGIT[b]:
+    pos += 1
+```
+
+Lexers with language-specific classes (e.g. JSON's strict RFC 8259
+whitespace) build their own table with `ascii_class_table()` instead of
+widening a shared one.
+
+**See Also:**
+
+- `rosettes.lexers._scanners`: frozenset-based classes for cold paths
+- `rosettes.lexers._state_machine`: base class and scan helpers
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "ascii_class_table",
+    "IS_WS",
+    "IS_DIGIT",
+    "IS_HEX",
+    "IS_IDENT_START",
+    "IS_IDENT_CONT",
+    "IS_IDENT_START_DOLLAR",
+    "IS_IDENT_CONT_DOLLAR",
+    "IS_TAG_NAME",
+    "IS_ATTR_NAME",
+]
+
+_ASCII_LETTERS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_ASCII_ALNUM = _ASCII_LETTERS + "0123456789"
+
+
+def ascii_class_table(chars: str) -> bytes:
+    """Build a 256-entry membership table for a character class.
+
+    Args:
+        chars: The characters in the class (all must be < U+0100).
+
+    Returns:
+        A ``bytes`` of length 256 where ``table[ord(c)]`` is 1 for
+        members and 0 otherwise.
+    """
+    return bytes(1 if chr(i) in chars else 0 for i in range(256))
+
+
+# Common classes, built once at import.
+IS_WS: bytes = ascii_class_table(" \t\n\r\f\v")
+IS_DIGIT: bytes = ascii_class_table("0123456789")
+IS_HEX: bytes = ascii_class_table("0123456789abcdefABCDEF")
+IS_IDENT_START: bytes = ascii_class_table(_ASCII_LETTERS + "_")
+IS_IDENT_CONT: bytes = ascii_class_table(_ASCII_ALNUM + "_")
+IS_IDENT_START_DOLLAR: bytes = ascii_class_table(_ASCII_LETTERS + "_$")
+IS_IDENT_CONT_DOLLAR: bytes = ascii_class_table(_ASCII_ALNUM + "_$")
+
+# Markup name classes (HTML/XML tag and attribute names). Non-ASCII
+# letters are valid in names; callers fall back to str.isalnum() for
+# bytes >= 128.
+IS_TAG_NAME: bytes = ascii_class_table(_ASCII_ALNUM + "-_:")
+IS_ATTR_NAME: bytes = ascii_class_table(_ASCII_ALNUM + "-_:.")
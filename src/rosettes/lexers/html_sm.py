@@ -40,10 +40,19 @@ from collections.abc import Iterator
 from rosettes._config import LexerConfig
 from rosettes._types import Token, TokenType
 from rosettes.lexers._state_machine import StateMachineLexer
+from rosettes.lexers._tables import IS_ATTR_NAME as _ATTR_NAME_CHAR
+from rosettes.lexers._tables import IS_TAG_NAME as _TAG_NAME_CHAR
 
 __all__ = ["HtmlStateMachineLexer"]
 
 
+# Pre-computed for fast lookup. Name scanning indexes the shared ASCII
+# class byte tables from _tables by ord(char), skipping the full
+# Unicode-aware str.isalnum() machinery for the ASCII bytes that
+# dominate real markup; non-ASCII falls back to it.
+_WHITESPACE = frozenset(" \t\n\r")
+
+
 class HtmlStateMachineLexer(StateMachineLexer):
     """HTML lexer with tag, attribute, and comment parsing.
 
@@ -79,45 +88,40 @@ class HtmlStateMachineLexer(StateMachineLexer):
             char = code[pos]
             col = pos - line_start + 1
 
-            # HTML comment <!-- -->
-            if char == "<" and code[pos : pos + 4] == "<!--":
+            # HTML comment <!-- --> - find the end marker in one C call and
+            # batch-count newlines in the comment body
+            if char == "<" and code.startswith("<!--", pos):
                 start = pos
-                pos += 4
                 start_line = line
-                while pos < length:
-                    if code[pos : pos + 3] == "-->":
-                        pos += 3
-                        break
-                    if code[pos] == "\n":
-                        line += 1
-                        line_start = pos + 1
-                    pos += 1
+                end_marker = code.find("-->", pos + 4)
+                # Unterminated comment runs to end of input
+                pos = end_marker + 3 if end_marker != -1 and end_marker < length else length
+                newlines = code.count("\n", start, pos)
+                if newlines:
+                    line += newlines
+                    line_start = code.rfind("\n", start, pos) + 1
                 yield Token(TokenType.COMMENT_MULTILINE, code[start:pos], start_line, col)
                 continue
 
             # DOCTYPE
             if char == "<" and code[pos : pos + 9].upper() == "<!DOCTYPE":
                 start = pos
-                while pos < length and code[pos] != ">":
-                    pos += 1
-                if pos < length:
-                    pos += 1
+                gt = code.find(">", pos, length)
+                pos = length if gt == -1 else gt + 1
                 yield Token(TokenType.COMMENT_PREPROC, code[start:pos], line, col)
                 continue
 
-            # CDATA
-            if char == "<" and code[pos : pos + 9] == "<![CDATA[":
+            # CDATA - same batched end-marker scan as comments
+            if char == "<" and code.startswith("<![CDATA[", pos):
                 start = pos
-                pos += 9
                 start_line = line
-                while pos < length:
-                    if code[pos : pos + 3] == "]]>":
-                        pos += 3
-                        break
-                    if code[pos] == "\n":
-                        line += 1
-                        line_start = pos + 1
-                    pos += 1
+                end_marker = code.find("]]>", pos + 9)
+                # Unterminated CDATA runs to end of input
+                pos = end_marker + 3 if end_marker != -1 and end_marker < length else length
+                newlines = code.count("\n", start, pos)
+                if newlines:
+                    line += newlines
+                    line_start = code.rfind("\n", start, pos) + 1
                 yield Token(TokenType.STRING, code[start:pos], start_line, col)
                 continue
 
@@ -132,7 +136,13 @@ class HtmlStateMachineLexer(StateMachineLexer):
 
                 # Tag name
                 tag_start = pos
-                while pos < length and (code[pos].isalnum() or code[pos] in "-_:"):
+                while pos < length:
+                    byte = ord(code[pos])
+                    if byte < 128:
+                        if not _TAG_NAME_CHAR[byte]:
+                            break
+                    elif not code[pos].isalnum():
+                        break
                     pos += 1
                 tag_name = code[tag_start:pos]
 
@@ -144,9 +154,9 @@ class HtmlStateMachineLexer(StateMachineLexer):
                     # Parse attributes
                     while pos < length:
                         # Whitespace
-                        if code[pos] in " \t\n\r":
+                        if code[pos] in _WHITESPACE:
                             ws_start = pos
-                            while pos < length and code[pos] in " \t\n\r":
+                            while pos < length and code[pos] in _WHITESPACE:
                                 if code[pos] == "\n":
                                     line += 1
                                     line_start = pos + 1
@@ -161,7 +171,7 @@ class HtmlStateMachineLexer(StateMachineLexer):
                             break
 
                         # Self-closing
-                        if code[pos : pos + 2] == "/>":
+                        if code.startswith("/>", pos):
                             yield Token(TokenType.PUNCTUATION, "/>", line, pos - line_start + 1)
                             pos += 2
                             break
@@ -169,7 +179,13 @@ class HtmlStateMachineLexer(StateMachineLexer):
                         # Attribute name
                         if code[pos].isalpha() or code[pos] in "_:":
                             attr_start = pos
-                            while pos < length and (code[pos].isalnum() or code[pos] in "-_:."):
+                            while pos < length:
+                                byte = ord(code[pos])
+                                if byte < 128:
+                                    if not _ATTR_NAME_CHAR[byte]:
+                                        break
+                                elif not code[pos].isalnum():
+                                    break
                                 pos += 1
                             yield Token(
                                 TokenType.NAME_ATTRIBUTE,
@@ -185,18 +201,17 @@ class HtmlStateMachineLexer(StateMachineLexer):
                             pos += 1
                             continue
 
-                        # Attribute value
+                        # Attribute value - find the closing quote in one
+                        # C call and batch-count newlines in the value
                         if code[pos] in "\"'":
                             quote = code[pos]
                             val_start = pos
-                            pos += 1
-                            while pos < length and code[pos] != quote:
-                                if code[pos] == "\n":
-                                    line += 1
-                                    line_start = pos + 1
-                                pos += 1
-                            if pos < length:
-                                pos += 1
+                            quote_end = code.find(quote, pos + 1, length)
+                            pos = length if quote_end == -1 else quote_end + 1
+                            newlines = code.count("\n", val_start, pos)
+                            if newlines:
+                                line += newlines
+                                line_start = code.rfind("\n", val_start, pos) + 1
                             yield Token(
                                 TokenType.STRING,
                                 code[val_start:pos],
@@ -224,15 +239,17 @@ class HtmlStateMachineLexer(StateMachineLexer):
                     yield Token(TokenType.TEXT, "<", line, col)
                 continue
 
-            # Text content
+            # Text content - jump to the next tag with C-level str.find and
+            # batch-count newlines instead of stepping per character
             if char != "<":
                 start = pos
-                while pos < length and code[pos] != "<":
-                    if code[pos] == "\n":
-                        line += 1
-                        line_start = pos + 1
-                    pos += 1
+                next_tag = code.find("<", pos, length)
+                pos = length if next_tag == -1 else next_tag
                 text = code[start:pos]
+                newlines = text.count("\n")
+                if newlines:
+                    line += newlines
+                    line_start = start + text.rfind("\n") + 1
                 if text.strip():
                     yield Token(TokenType.TEXT, text, line, col)
                 elif text:
@@ -49,7 +49,7 @@ from collections.abc import Iterator
 from rosettes._config import LexerConfig
 from rosettes._types import Token, TokenType
 from rosettes.lexers._scanners import (
-    IDENT_START_DOLLAR,
+    DIGITS,
     # Mixins
     CStyleCommentsMixin,
     CStyleNumbersMixin,
@@ -60,7 +60,9 @@ from rosettes.lexers._scanners import (
     OperatorConfig,
     StringConfig,
     # Helpers
+    scan_c_style_number,
     scan_identifier,
+    scan_string,
 )
 from rosettes.lexers._state_machine import StateMachineLexer
 
@@ -182,6 +184,62 @@ _BUILTINS: frozenset[str] = frozenset(
 )
 
 
+# Single-probe classification table: word -> TokenType. Built once at
+# import so _classify_word costs one dict lookup instead of up to six
+# frozenset/tuple membership tests per identifier.
+_WORD_TYPE: dict[str, TokenType] = {
+    **dict.fromkeys(_KEYWORDS, TokenType.KEYWORD),
+    **dict.fromkeys(("function", "class", "const", "let", "var"), TokenType.KEYWORD_DECLARATION),
+    # "from" is contextual, not a reserved word — it stays a plain NAME
+    **dict.fromkeys(("import", "export"), TokenType.KEYWORD_NAMESPACE),
+    **dict.fromkeys(_CONSTANTS, TokenType.KEYWORD_CONSTANT),
+    **dict.fromkeys(_RESERVED, TokenType.KEYWORD_RESERVED),
+    **dict.fromkeys(_BUILTINS, TokenType.NAME_BUILTIN),
+}
+
+
+# =============================================================================
+# Character-class dispatch table
+# =============================================================================
+
+# Small-int class codes for the 128-entry ASCII dispatch table. The main
+# tokenize loop indexes this table once per token instead of walking a
+# ladder of frozenset membership tests and _try_* calls that mostly miss.
+_CC_OTHER = 0  # Unknown char -> ERROR token
+_CC_WS = 1  # Whitespace run
+_CC_SLASH = 2  # Comment or division operator
+_CC_QUOTE = 3  # String literal (", ', `)
+_CC_DIGIT = 4  # Number literal
+_CC_DOT = 5  # Float like .5, else operator
+_CC_IDENT = 6  # Identifier / keyword / builtin
+_CC_OP = 7  # Operator (longest-first)
+_CC_PUNCT = 8  # Single-char punctuation
+
+
+def _build_char_class_table() -> tuple[int, ...]:
+    """Build the 128-entry ASCII character-class dispatch table."""
+    table = [_CC_OTHER] * 128
+    for char in " \t\n\r\f\v":
+        table[ord(char)] = _CC_WS
+    table[ord("/")] = _CC_SLASH
+    for char in "\"'`":
+        table[ord(char)] = _CC_QUOTE
+    for char in "0123456789":
+        table[ord(char)] = _CC_DIGIT
+    table[ord(".")] = _CC_DOT
+    for char in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_$":
+        table[ord(char)] = _CC_IDENT
+    # Operators take precedence over punctuation for shared chars (: .)
+    for char in "()[]{};,":
+        table[ord(char)] = _CC_PUNCT
+    for char in "+-*%&|^~!<>=?:":
+        table[ord(char)] = _CC_OP
+    return tuple(table)
+
+
+_CHAR_CLASS: tuple[int, ...] = _build_char_class_table()
+
+
 # =============================================================================
 # Lexer implementation using mixins
 # =============================================================================
@@ -273,21 +331,39 @@ class JavaScriptStateMachineLexer(
         start: int = 0,
         end: int | None = None,
     ) -> Iterator[Token]:
-        """Tokenize JavaScript source code."""
+        """Tokenize JavaScript source code.
+
+        The scanner bodies from the C-style mixins are inlined here with
+        the JS configuration baked in as constants: the `_try_*` methods
+        allocate and unpack a result tuple per attempt, which dominates
+        the per-token cost in CPython. The mixin methods remain the
+        reference path (and serve TypeScript and other subclasses).
+        """
         pos = start
         length = end if end is not None else len(code)
         line = 1
         line_start = start
 
+        # Cache lookups - rebinding to locals turns per-iteration
+        # LOAD_ATTR/MRO walks into cheap LOAD_FASTs
+        whitespace = self.WHITESPACE
+        digits = DIGITS
+        number_config = self.NUMBER_CONFIG
+        op_by_first = self.OPERATOR_CONFIG.by_first
+        word_type = _WORD_TYPE
+        char_class = _CHAR_CLASS
+
         while pos < length:
             char = code[pos]
             col = pos - line_start + 1
+            byte = ord(char)
+            cls = char_class[byte] if byte < 128 else _CC_OTHER
 
             # Whitespace
-            if char in self.WHITESPACE:
+            if cls == _CC_WS:
                 start = pos
                 start_line = line
-                while pos < length and code[pos] in self.WHITESPACE:
+                while pos < length and code[pos] in whitespace:
                     if code[pos] == "\n":
                         line += 1
                         line_start = pos + 1
@@ -295,54 +371,93 @@ class JavaScriptStateMachineLexer(
                 yield Token(TokenType.WHITESPACE, code[start:pos], start_line, col)
                 continue
 
-            # Comments (// and /* */)
-            token, new_pos = self._try_comment(code, pos, line, col)
-            if token:
-                # Track newlines in block comments
-                if token.type == TokenType.COMMENT_MULTILINE:
-                    newlines = token.value.count("\n")
+            # Identifiers (including keywords and builtins)
+            if cls == _CC_IDENT:
+                start = pos
+                pos = scan_identifier(code, pos, allow_dollar=True)
+                word = code[start:pos]
+                yield Token(word_type.get(word, TokenType.NAME), word, line, col)
+                continue
+
+            # Comments (// and /* */) or division operator
+            if cls == _CC_SLASH:
+                next_char = code[pos + 1] if pos + 1 < len(code) else ""
+                if next_char == "/":
+                    # Line comment
+                    eol = code.find("\n", pos + 2)
+                    new_pos = len(code) if eol == -1 else eol
+                    yield Token(TokenType.COMMENT_SINGLE, code[pos:new_pos], line, col)
+                    pos = new_pos
+                    continue
+                if next_char == "*":
+                    # Block comment - track newlines in the body
+                    end_marker = code.find("*/", pos + 2)
+                    new_pos = len(code) if end_marker == -1 else end_marker + 2
+                    value = code[pos:new_pos]
+                    token = Token(TokenType.COMMENT_MULTILINE, value, line, col)
+                    newlines = value.count("\n")
                     if newlines:
                         line += newlines
-                        line_start = pos + token.value.rfind("\n") + 1
-                yield token
-                pos = new_pos
+                        line_start = pos + value.rfind("\n") + 1
+                    yield token
+                    pos = new_pos
+                    continue
+                # Division operator (falls through to operator matching)
+                candidates = op_by_first.get(char)
+                op = char
+                if candidates:
+                    for candidate in candidates:
+                        if code.startswith(candidate, pos):
+                            op = candidate
+                            break
+                yield Token(TokenType.OPERATOR, op, line, col)
+                pos += len(op)
                 continue
 
             # Strings (", ', `)
-            token, new_pos, newlines = self._try_string(code, pos, line, col)
-            if token:
+            if cls == _CC_QUOTE:
+                str_end, newlines = scan_string(code, pos + 1, char, allow_multiline=char == "`")
+                token = Token(TokenType.STRING, code[pos:str_end], line, col)
                 if newlines:
                     line += newlines
                     line_start = pos + token.value.rfind("\n") + 1
                 yield token
-                pos = new_pos
+                pos = str_end
                 continue
 
             # Numbers
-            token, new_pos = self._try_number(code, pos, line, col)
-            if token:
-                yield token
+            if cls == _CC_DIGIT:
+                token_type, new_pos = scan_c_style_number(code, pos, number_config)
+                yield Token(token_type, code[pos:new_pos], line, col)
                 pos = new_pos
                 continue
 
-            # Identifiers (including keywords and builtins)
-            if char in IDENT_START_DOLLAR:
-                start = pos
-                pos = scan_identifier(code, pos, allow_dollar=True)
-                word = code[start:pos]
-                token_type = self._classify_word(word)
-                yield Token(token_type, word, line, col)
+            # Leading-dot float (.5), else operator
+            if cls == _CC_DOT:
+                if pos + 1 < len(code) and code[pos + 1] in digits:
+                    token_type, new_pos = scan_c_style_number(code, pos, number_config)
+                    yield Token(token_type, code[pos:new_pos], line, col)
+                    pos = new_pos
+                    continue
+                yield Token(TokenType.OPERATOR, ".", line, col)
+                pos += 1
                 continue
 
-            # Operators
-            token, new_pos = self._try_operator(code, pos, line, col)
-            if token:
-                yield token
-                pos = new_pos
+            # Operators (longest-first via the first-char candidate table)
+            if cls == _CC_OP:
+                candidates = op_by_first.get(char)
+                op = char
+                if candidates:
+                    for candidate in candidates:
+                        if code.startswith(candidate, pos):
+                            op = candidate
+                            break
+                yield Token(TokenType.OPERATOR, op, line, col)
+                pos += len(op)
                 continue
 
             # Punctuation
-            if char in "()[]{}:;,.":
+            if cls == _CC_PUNCT:
                 yield Token(TokenType.PUNCTUATION, char, line, col)
                 pos += 1
                 continue
@@ -352,21 +467,5 @@ class JavaScriptStateMachineLexer(
             pos += 1
 
     def _classify_word(self, word: str) -> TokenType:
-        """Classify an identifier."""
-        if word in _KEYWORDS:
-            if word in ("function", "class", "const", "let", "var"):
-                return TokenType.KEYWORD_DECLARATION
-            if word in ("import", "export", "from"):
-                return TokenType.KEYWORD_NAMESPACE
-            return TokenType.KEYWORD
-
-        if word in _CONSTANTS:
-            return TokenType.KEYWORD_CONSTANT
-
-        if word in _RESERVED:
-            return TokenType.KEYWORD_RESERVED
-
-        if word in _BUILTINS:
-            return TokenType.NAME_BUILTIN
-
-        return TokenType.NAME
+        """Classify an identifier with a single dict probe."""
+        return _WORD_TYPE.get(word, TokenType.NAME)
@@ -47,12 +47,19 @@ from collections.abc import Iterator
 from rosettes._config import LexerConfig
 from rosettes._types import Token, TokenType
 from rosettes.lexers._state_machine import StateMachineLexer
+from rosettes.lexers._tables import IS_DIGIT as _IS_DIGIT
+from rosettes.lexers._tables import ascii_class_table
 
 __all__ = ["JsonStateMachineLexer"]
 
 
-# Pre-computed for fast lookup
-_DIGITS = frozenset("0123456789")
+# Pre-computed for fast lookup. The 256-entry byte tables are indexed by
+# ord(char) — a single C-level bytes load, cheaper than hashing into a
+# frozenset. Characters above U+00FF short-circuit on the < 256 guard.
+# Whitespace is JSON's strict RFC 8259 set (no \f \v), so it gets its
+# own table rather than the shared IS_WS.
+_IS_WS = ascii_class_table(" \t\n\r")
+_PUNCTUATION = frozenset("[]{},:")
 
 
 class JsonStateMachineLexer(StateMachineLexer):
@@ -90,49 +97,57 @@ class JsonStateMachineLexer(StateMachineLexer):
         while pos < length:
             char = code[pos]
             col = pos - line_start + 1
+            byte = ord(char)
 
             # Whitespace - inline for speed
-            if char in " \t\n\r":
+            if byte < 256 and _IS_WS[byte]:
                 start = pos
                 start_line = line
-                while pos < length and code[pos] in " \t\n\r":
-                    if code[pos] == "\n":
+                while pos < length and (b := ord(code[pos])) < 256 and _IS_WS[b]:
+                    if b == 10:  # newline
                         line += 1
                         line_start = pos + 1
                     pos += 1
                 yield Token(TokenType.WHITESPACE, code[start:pos], start_line, col)
                 continue
 
-            # Strings - simple inline scanning (JSON strings can't span lines)
+            # Strings - batch scan via C-level str.find instead of per-char
+            # stepping. Escaped quotes are detected by counting the run of
+            # preceding backslashes (odd count = escaped).
             if char == '"':
                 start = pos
-                pos += 1
-                while pos < length:
-                    c = code[pos]
-                    if c == '"':
-                        pos += 1
+                search = pos + 1
+                while True:
+                    quote_pos = code.find('"', search, length)
+                    if quote_pos == -1:
+                        pos = length  # Unterminated string
                         break
-                    if c == "\\":
-                        pos += 2  # Skip escape sequence
-                    else:
-                        pos += 1
+                    backslashes = 0
+                    check = quote_pos - 1
+                    while check > start and code[check] == "\\":
+                        backslashes += 1
+                        check -= 1
+                    if backslashes % 2 == 0:
+                        pos = quote_pos + 1
+                        break
+                    search = quote_pos + 1
                 yield Token(TokenType.STRING, code[start:pos], line, col)
                 continue
 
             # Numbers - inline for speed
-            if char in _DIGITS or char == "-":
+            if char == "-" or (byte < 256 and _IS_DIGIT[byte]):
                 start = pos
                 if char == "-":
                     pos += 1
                 # Integer part
-                while pos < length and code[pos] in _DIGITS:
+                while pos < length and (b := ord(code[pos])) < 256 and _IS_DIGIT[b]:
                     pos += 1
                 # Fractional part
                 is_float = False
                 if pos < length and code[pos] == ".":
                     is_float = True
                     pos += 1
-                    while pos < length and code[pos] in _DIGITS:
+                    while pos < length and (b := ord(code[pos])) < 256 and _IS_DIGIT[b]:
                         pos += 1
                 # Exponent
                 if pos < length and code[pos] in "eE":
@@ -140,31 +155,127 @@ class JsonStateMachineLexer(StateMachineLexer):
                     pos += 1
                     if pos < length and code[pos] in "+-":
                         pos += 1
-                    while pos < length and code[pos] in _DIGITS:
+                    while pos < length and (b := ord(code[pos])) < 256 and _IS_DIGIT[b]:
                         pos += 1
                 token_type = TokenType.NUMBER_FLOAT if is_float else TokenType.NUMBER_INTEGER
                 yield Token(token_type, code[start:pos], line, col)
                 continue
 
-            # Constants - direct comparison (faster than loop)
-            if char == "t" and code[pos : pos + 4] == "true":
+            # Constants - startswith with offset avoids a slice per probe
+            if char == "t" and code.startswith("true", pos):
                 yield Token(TokenType.KEYWORD_CONSTANT, "true", line, col)
                 pos += 4
                 continue
-            if char == "f" and code[pos : pos + 5] == "false":
+            if char == "f" and code.startswith("false", pos):
                 yield Token(TokenType.KEYWORD_CONSTANT, "false", line, col)
                 pos += 5
                 continue
-            if char == "n" and code[pos : pos + 4] == "null":
+            if char == "n" and code.startswith("null", pos):
                 yield Token(TokenType.KEYWORD_CONSTANT, "null", line, col)
                 pos += 4
                 continue
 
             # Punctuation
-            if char in "[]{},:":
+            if char in _PUNCTUATION:
                 yield Token(TokenType.PUNCTUATION, char, line, col)
                 pos += 1
                 continue
 
             yield Token(TokenType.ERROR, char, line, col)
             pos += 1
+
+    def tokenize_fast(
+        self,
+        code: str,
+        start: int = 0,
+        end: int | None = None,
+    ) -> Iterator[tuple[TokenType, str]]:
+        """Fused fast path yielding (TokenType, value) tuples.
+
+        Skips Token construction and line/column tracking entirely —
+        the highlight() fast path only consumes type and value, so this
+        avoids one object allocation and two counters per token.
+        """
+        pos = start
+        length = end if end is not None else len(code)
+
+        while pos < length:
+            char = code[pos]
+            byte = ord(char)
+
+            # Whitespace - no newline bookkeeping needed on this path
+            if byte < 256 and _IS_WS[byte]:
+                start = pos
+                pos += 1
+                while pos < length and (b := ord(code[pos])) < 256 and _IS_WS[b]:
+                    pos += 1
+                yield (TokenType.WHITESPACE, code[start:pos])
+                continue
+
+            # Strings
+            if char == '"':
+                start = pos
+                search = pos + 1
+                while True:
+                    quote_pos = code.find('"', search, length)
+                    if quote_pos == -1:
+                        pos = length  # Unterminated string
+                        break
+                    backslashes = 0
+                    check = quote_pos - 1
+                    while check > start and code[check] == "\\":
+                        backslashes += 1
+                        check -= 1
+                    if backslashes % 2 == 0:
+                        pos = quote_pos + 1
+                        break
+                    search = quote_pos + 1
+                yield (TokenType.STRING, code[start:pos])
+                continue
+
+            # Numbers
+            if char == "-" or (byte < 256 and _IS_DIGIT[byte]):
+                start = pos
+                if char == "-":
+                    pos += 1
+                while pos < length and (b := ord(code[pos])) < 256 and _IS_DIGIT[b]:
+                    pos += 1
+                is_float = False
+                if pos < length and code[pos] == ".":
+                    is_float = True
+                    pos += 1
+                    while pos < length and (b := ord(code[pos])) < 256 and _IS_DIGIT[b]:
+                        pos += 1
+                if pos < length and code[pos] in "eE":
+                    is_float = True
+                    pos += 1
+                    if pos < length and code[pos] in "+-":
+                        pos += 1
+                    while pos < length and (b := ord(code[pos])) < 256 and _IS_DIGIT[b]:
+                        pos += 1
+                token_type = TokenType.NUMBER_FLOAT if is_float else TokenType.NUMBER_INTEGER
+                yield (token_type, code[start:pos])
+                continue
+
+            # Constants
+            if char == "t" and code.startswith("true", pos):
+                yield (TokenType.KEYWORD_CONSTANT, "true")
+                pos += 4
+                continue
+            if char == "f" and code.startswith("false", pos):
+                yield (TokenType.KEYWORD_CONSTANT, "false")
+                pos += 5
+                continue
+            if char == "n" and code.startswith("null", pos):
+                yield (TokenType.KEYWORD_CONSTANT, "null")
+                pos += 4
+                continue
+
+            # Punctuation
+            if char in _PUNCTUATION:
+                yield (TokenType.PUNCTUATION, char)
+                pos += 1
+                continue
+
+            yield (TokenType.ERROR, char)
+            pos += 1
@@ -48,6 +48,36 @@ from rosettes.lexers._state_machine import StateMachineLexer
 __all__ = ["MarkdownStateMachineLexer"]
 
 
+# Characters that terminate a plain-text run (inline markers, block
+# markers, newline). Kept as a tuple for the stop-scan cascade below.
+_TEXT_STOP_CHARS = tuple("\n`*_[]!#>-+")
+
+# Characters allowed on a horizontal-rule line, per rule character.
+_HR_ALLOWED = {
+    "-": frozenset("- \t"),
+    "*": frozenset("* \t"),
+    "_": frozenset("_ \t"),
+}
+
+
+def _find_text_stop(code: str, pos: int, length: int) -> int:
+    """Find the nearest markdown special character at or after ``pos``.
+
+    Runs one bounded C-level ``str.find`` per stop character, each search
+    narrowed to the best match so far. For long prose runs this is far
+    cheaper than testing every character against the stop set in Python,
+    and it keeps the lexer regex-free.
+    """
+    stop = length
+    for char in _TEXT_STOP_CHARS:
+        found = code.find(char, pos, stop)
+        if found != -1:
+            stop = found
+            if stop == pos:
+                break
+    return stop
+
+
 class MarkdownStateMachineLexer(StateMachineLexer):
     """Markdown lexer with CommonMark syntax support.
 
@@ -117,17 +147,20 @@ class MarkdownStateMachineLexer(StateMachineLexer):
                     pos += 1
                     line += 1
                     line_start = pos
-                # Find closing ```
-                while pos < length:
-                    if code[pos] == "\n":
-                        line += 1
-                        line_start = pos + 1
-                        if pos + 4 < length and code[pos + 1 : pos + 4] == "```":
-                            pos += 4
-                            while pos < length and code[pos] != "\n":
-                                pos += 1
-                            break
-                    pos += 1
+                # Find closing ``` (at line start, with input remaining after
+                # it) in one C-level search, then batch-count body newlines
+                scan_start = pos
+                close = code.find("\n```", pos, length)
+                if close != -1 and close + 4 < length:
+                    pos = close + 4
+                    eol = code.find("\n", pos, length)
+                    pos = length if eol == -1 else eol
+                else:
+                    pos = length  # Unterminated fence
+                newlines = code.count("\n", scan_start, pos)
+                if newlines:
+                    line += newlines
+                    line_start = code.rfind("\n", scan_start, pos) + 1
                 yield Token(TokenType.STRING, code[start:pos], start_line, col)
                 at_line_start = False
                 continue
@@ -191,29 +224,31 @@ class MarkdownStateMachineLexer(StateMachineLexer):
                 continue
 
             # Horizontal rules --- *** ___
+            # Validated against the whole line at once: one find for the
+            # line end, one count, one set comparison — no per-char scan
+            # (and no f-string rebuilt per candidate).
             if at_line_start and char in "-*_":
-                start = pos
-                rule_char = char
-                count = 0
-                temp = pos
-                while temp < length and code[temp] in f"{rule_char} \t":
-                    if code[temp] == rule_char:
-                        count += 1
-                    temp += 1
-                if count >= 3 and (temp >= length or code[temp] == "\n"):
-                    pos = temp
-                    yield Token(TokenType.PUNCTUATION, code[start:pos], line, col)
+                eol = code.find("\n", pos, length)
+                line_end = length if eol == -1 else eol
+                candidate = code[pos:line_end]
+                if candidate.count(char) >= 3 and not set(candidate) - _HR_ALLOWED[char]:
+                    pos = line_end
+                    yield Token(TokenType.PUNCTUATION, candidate, line, col)
                     at_line_start = False
                     continue
 
-            # Inline code `code`
+            # Inline code `code` - one find for the closing tick, bounded
+            # by the line end (inline code never spans lines)
             if char == "`":
                 start = pos
-                pos += 1
-                while pos < length and code[pos] != "`" and code[pos] != "\n":
-                    pos += 1
-                if pos < length and code[pos] == "`":
-                    pos += 1
+                tick = code.find("`", pos + 1, length)
+                nl = code.find("\n", pos + 1, tick if tick != -1 else length)
+                if nl != -1:
+                    pos = nl
+                elif tick != -1:
+                    pos = tick + 1
+                else:
+                    pos = length
                 yield Token(TokenType.STRING, code[start:pos], line, col)
                 at_line_start = False
                 continue
@@ -253,51 +288,61 @@ class MarkdownStateMachineLexer(StateMachineLexer):
                     pos += 1
                 if pos < length and code[pos - 1] == "]":
                     if pos < length and code[pos] == "(":
-                        # URL follows
-                        pos += 1
-                        while pos < length and code[pos] != ")" and code[pos] != "\n":
-                            pos += 1
-                        if pos < length and code[pos] == ")":
-                            pos += 1
+                        # URL follows - batch scan to ) bounded by line end
+                        close = code.find(")", pos + 1, length)
+                        nl = code.find("\n", pos + 1, close if close != -1 else length)
+                        if nl != -1:
+                            pos = nl
+                        elif close != -1:
+                            pos = close + 1
+                        else:
+                            pos = length
                     elif pos < length and code[pos] == "[":
-                        # Reference follows
-                        pos += 1
-                        while pos < length and code[pos] != "]" and code[pos] != "\n":
-                            pos += 1
-                        if pos < length and code[pos] == "]":
-                            pos += 1
+                        # Reference follows - batch scan to ] bounded by line end
+                        close = code.find("]", pos + 1, length)
+                        nl = code.find("\n", pos + 1, close if close != -1 else length)
+                        if nl != -1:
+                            pos = nl
+                        elif close != -1:
+                            pos = close + 1
+                        else:
+                            pos = length
                 yield Token(TokenType.NAME_LABEL, code[start:pos], line, col)
                 at_line_start = False
                 continue
 
-            # Images ![alt](url)
+            # Images ![alt](url) - same batched scans as links
             if char == "!" and pos + 1 < length and code[pos + 1] == "[":
                 start = pos
-                pos += 2
-                while pos < length and code[pos] != "]" and code[pos] != "\n":
-                    pos += 1
-                if pos < length and code[pos] == "]":
-                    pos += 1
-                    if pos < length and code[pos] == "(":
-                        pos += 1
-                        while pos < length and code[pos] != ")" and code[pos] != "\n":
-                            pos += 1
-                        if pos < length and code[pos] == ")":
-                            pos += 1
+                close = code.find("]", pos + 2, length)
+                nl = code.find("\n", pos + 2, close if close != -1 else length)
+                if nl != -1:
+                    pos = nl
+                elif close != -1:
+                    pos = close + 1
+                else:
+                    pos = length
+                if pos < length and code[pos - 1] == "]" and code[pos] == "(":
+                    close = code.find(")", pos + 1, length)
+                    nl = code.find("\n", pos + 1, close if close != -1 else length)
+                    if nl != -1:
+                        pos = nl
+                    elif close != -1:
+                        pos = close + 1
+                    else:
+                        pos = length
                 yield Token(TokenType.NAME_LABEL, code[start:pos], line, col)
                 at_line_start = False
                 continue
 
-            # Regular text
+            # Regular text - batch scan to the next special character
             start = pos
-            while pos < length and code[pos] not in "\n`*_[]!#>-+":
-                if code[pos] in " \t":
-                    pos += 1
-                else:
-                    pos += 1
-                    at_line_start = False
+            pos = _find_text_stop(code, pos, length)
             if pos > start:
-                yield Token(TokenType.TEXT, code[start:pos], line, col)
+                text = code[start:pos]
+                if text.strip(" \t"):
+                    at_line_start = False
+                yield Token(TokenType.TEXT, text, line, col)
                 continue
 
             # Whitespace
@@ -85,22 +85,23 @@ from rosettes.themes._mapping import (
 from rosettes.themes._palette import AdaptivePalette, SyntaxPalette
 from rosettes.themes._roles import SyntaxRole
 
-# Built-in palettes
-from rosettes.themes.palettes import (
-    BENGAL_BLUE,
-    BENGAL_CHARCOAL,
-    BENGAL_SNOW_LYNX,
-    BENGAL_TIGER,
-    DRACULA,
-    GITHUB,
-    GITHUB_DARK,
-    GITHUB_LIGHT,
-    MONOKAI,
-)
-
 if TYPE_CHECKING:
     from typing import Literal
 
+    # Built-in palettes are loaded lazily via __getattr__ below;
+    # import eagerly only for type checkers.
+    from rosettes.themes.palettes import (
+        BENGAL_BLUE,
+        BENGAL_CHARCOAL,
+        BENGAL_SNOW_LYNX,
+        BENGAL_TIGER,
+        DRACULA,
+        GITHUB,
+        GITHUB_DARK,
+        GITHUB_LIGHT,
+        MONOKAI,
+    )
+
     CssClassStyle = Literal["semantic", "pygments"]
 
 __all__ = [
@@ -136,42 +137,85 @@ __all__ = [
 Palette = SyntaxPalette | AdaptivePalette
 
 
-# Palette registry (populated with built-ins)
+# Palette registry (built-ins materialize on first lookup; custom
+# palettes land here via register_palette)
 _PALETTES: dict[str, Palette] = {}
 
+# Sorted name cache for list_palettes(); invalidated on registration
+_sorted_names: tuple[str, ...] | None = None
 
-def _init_registry() -> None:
-    """Initialize the palette registry with built-in palettes."""
-    global _PALETTES
-
+# registry key -> attribute in rosettes.themes.palettes
+_BUILTIN_NAMES: dict[str, str] = {
     # Bengal themes
-    _PALETTES["bengal-tiger"] = BENGAL_TIGER
-    _PALETTES["bengal-snow-lynx"] = BENGAL_SNOW_LYNX
-    _PALETTES["bengal-charcoal"] = BENGAL_CHARCOAL
-    _PALETTES["bengal-blue"] = BENGAL_BLUE
-
+    "bengal-tiger": "BENGAL_TIGER",
+    "bengal-snow-lynx": "BENGAL_SNOW_LYNX",
+    "bengal-charcoal": "BENGAL_CHARCOAL",
+    "bengal-blue": "BENGAL_BLUE",
     # Third-party themes
-    _PALETTES["monokai"] = MONOKAI
-    _PALETTES["dracula"] = DRACULA
-    _PALETTES["github"] = GITHUB
-    _PALETTES["github-light"] = GITHUB_LIGHT
-    _PALETTES["github-dark"] = GITHUB_DARK
+    "monokai": "MONOKAI",
+    "dracula": "DRACULA",
+    "github": "GITHUB",
+    "github-light": "GITHUB_LIGHT",
+    "github-dark": "GITHUB_DARK",
+}
+
+_PALETTE_EXPORTS: frozenset[str] = frozenset(_BUILTIN_NAMES.values())
+
+
+def __getattr__(name: str) -> Palette:
+    """Load built-in palettes lazily (PEP 562).
+
+    `import rosettes.themes` no longer constructs the nine built-in
+    palettes up front; they materialize on first attribute access (or
+    on first registry lookup) and are cached in the module namespace.
+    """
+    if name in _PALETTE_EXPORTS:
+        from rosettes.themes import palettes as _builtin
+
+        value = getattr(_builtin, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _canonical(name: str) -> str:
+    """Normalize a palette name to its registry key.
+
+    Lowercase with underscores folded to hyphens, so "GitHub_Dark",
+    "github_dark" and "github-dark" all resolve to the same palette.
+    """
+    return name.lower().replace("_", "-")
 
 
 def register_palette(palette: Palette) -> None:
     """Register a custom palette.
 
+    Names are case-insensitive; underscores and hyphens are
+    interchangeable.
+
     Args:
         palette: The palette to register.
     """
-    _PALETTES[palette.name] = palette
+    global _sorted_names
+    _PALETTES[_canonical(palette.name)] = palette
+    _sorted_names = None
+
+
+def _palette_names() -> tuple[str, ...]:
+    """Return the sorted palette names, cached until registration."""
+    global _sorted_names
+    names = _sorted_names
+    if names is None:
+        names = _sorted_names = tuple(sorted(_PALETTES.keys() | _BUILTIN_NAMES.keys()))
+    return names
 
 
 def get_palette(name: str) -> Palette:
     """Get a registered palette by name.
 
     Args:
-        name: The palette name.
+        name: The palette name (case-insensitive; underscores and
+            hyphens are interchangeable).
 
     Returns:
         The requested palette.
@@ -179,15 +223,19 @@ def get_palette(name: str) -> Palette:
     Raises:
         LookupError: If the palette is not registered.
     """
-    # Lazy init
-    if not _PALETTES:
-        _init_registry()
+    name = _canonical(name)
+    palette = _PALETTES.get(name)
+    if palette is None:
+        # Built-ins materialize into the registry on first lookup
+        attr = _BUILTIN_NAMES.get(name)
+        if attr is None:
+            available = ", ".join(_palette_names())
+            raise LookupError(f"Unknown syntax theme: {name!r}. Available: {available}")
+        from rosettes.themes import palettes as _builtin
 
-    if name not in _PALETTES:
-        available = ", ".join(sorted(_PALETTES.keys()))
-        raise LookupError(f"Unknown syntax theme: {name!r}. Available: {available}")
+        palette = _PALETTES[name] = getattr(_builtin, attr)
 
-    return _PALETTES[name]
+    return palette
 
 
 def list_palettes() -> list[str]:
@@ -196,8 +244,4 @@ def list_palettes() -> list[str]:
     Returns:
         Sorted list of palette names.
     """
-    # Lazy init
-    if not _PALETTES:
-        _init_registry()
-
-    return sorted(_PALETTES.keys())
+    return list(_palette_names())
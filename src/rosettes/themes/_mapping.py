@@ -183,6 +183,13 @@ PYGMENTS_CLASS_MAP: dict[SyntaxRole, str] = {
 }
 
 
+# Complete table with the TEXT fallback baked in, so per-token role
+# resolution is a plain subscript rather than .get() with a default.
+_ROLE_OF: dict[TokenType, SyntaxRole] = {
+    _tt: ROLE_MAPPING.get(_tt, SyntaxRole.TEXT) for _tt in TokenType
+}
+
+
 def get_role(token_type: TokenType) -> SyntaxRole:
     """Get the semantic role for a token type.
 
@@ -192,4 +199,4 @@ def get_role(token_type: TokenType) -> SyntaxRole:
     Returns:
         The corresponding semantic role, or TEXT if not mapped.
     """
-    return ROLE_MAPPING.get(token_type, SyntaxRole.TEXT)
+    return _ROLE_OF[token_type]
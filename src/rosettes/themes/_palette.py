@@ -69,7 +69,8 @@ modified. Safe to share across threads.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -80,6 +81,53 @@ if TYPE_CHECKING:
 __all__ = ["SyntaxPalette", "AdaptivePalette"]
 
 
+# (css variable suffix, palette attribute) schema for to_css_vars().
+# Data-driven: adding a role means one tuple entry, not a new f-string.
+_CSS_FIELDS: tuple[tuple[str, str], ...] = (
+    ("bg", "background"),
+    ("bg-highlight", "background_highlight"),
+    ("control", "control_flow"),
+    ("declaration", "declaration"),
+    ("import", "import_"),
+    ("string", "string"),
+    ("number", "number"),
+    ("boolean", "boolean"),
+    ("type", "type_"),
+    ("function", "function"),
+    ("variable", "variable"),
+    ("constant", "constant"),
+    ("comment", "comment"),
+    ("docstring", "docstring"),
+    ("error", "error"),
+    ("warning", "warning"),
+    ("added", "added"),
+    ("removed", "removed"),
+    ("text", "text"),
+    ("muted", "muted"),
+    ("punctuation", "punctuation"),
+    ("operator", "operator"),
+    ("attribute", "attribute"),
+    ("namespace", "namespace"),
+    ("tag", "tag"),
+    ("regex", "regex"),
+    ("escape", "escape"),
+)
+
+# Every string field, for interning in __post_init__ (the CSS schema
+# attributes plus the name).
+_STR_FIELDS: tuple[str, ...] = ("name", *(attr for _css, attr in _CSS_FIELDS))
+
+# Fields that with_defaults() may need to fill. When all are already
+# non-empty the palette is its own fill.
+_OPTIONAL_FIELDS: tuple[str, ...] = tuple(
+    attr for attr in _STR_FIELDS if attr not in ("name", "background", "text")
+)
+
+# Indent prefixes used by to_css_vars(); the common widths are
+# pre-built so repeated CSS generation never re-allocates them.
+_INDENT_CACHE: dict[int, str] = {0: "", 2: "  ", 4: "    ", 6: "      ", 8: "        "}
+
+
 @dataclass(frozen=True, slots=True)
 class SyntaxPalette:
     """Immutable syntax highlighting palette.
@@ -160,6 +208,14 @@ class SyntaxPalette:
     italic_comment: bool = True
     italic_docstring: bool = True
 
+    # Memoized with_defaults() result. Safe on a frozen palette: the
+    # filled palette is a pure function of self, so a racing double
+    # compute just stores the same value twice (idempotent).
+    _filled: SyntaxPalette | None = field(default=None, init=False, repr=False, compare=False)
+
+    # Memoized to_css_vars(indent=0) result; indents are derived from it.
+    _css_vars: str | None = field(default=None, init=False, repr=False, compare=False)
+
     def __post_init__(self) -> None:
         """Validate palette after initialization."""
         if not self.name:
@@ -168,10 +224,32 @@ class SyntaxPalette:
             raise ValueError("Background color is required")
         if not self.text:
             raise ValueError("Text color is required")
+        # Intern the color strings: the same hex values recur across the
+        # built-in palettes and their with_defaults() copies, so
+        # duplicates collapse to one shared string object
+        for attr in _STR_FIELDS:
+            value: str = getattr(self, attr)
+            if value:
+                object.__setattr__(self, attr, sys.intern(value))
 
     def with_defaults(self) -> SyntaxPalette:
-        """Return a new palette with empty fields filled from defaults."""
-        return SyntaxPalette(
+        """Return a new palette with empty fields filled from defaults.
+
+        The result is memoized on the instance: repeated CSS generation
+        pays the ~30 fallback evaluations and dataclass construction
+        only once per palette.
+        """
+        filled = self._filled
+        if filled is not None:
+            return filled
+        for attr in _OPTIONAL_FIELDS:
+            if not getattr(self, attr):
+                break
+        else:
+            # Fully specified palette (the built-ins) — it is its own fill
+            object.__setattr__(self, "_filled", self)
+            return self
+        filled = SyntaxPalette(
             name=self.name,
             background=self.background,
             text=self.text,
@@ -205,42 +283,29 @@ class SyntaxPalette:
             italic_comment=self.italic_comment,
             italic_docstring=self.italic_docstring,
         )
+        # A filled palette is its own fill; chain both caches
+        object.__setattr__(filled, "_filled", filled)
+        object.__setattr__(self, "_filled", filled)
+        return filled
 
     def to_css_vars(self, indent: int = 0) -> str:
-        """Generate CSS custom property declarations."""
-        prefix = " " * indent
-        filled = self.with_defaults()
+        """Generate CSS custom property declarations.
 
-        lines = [
-            f"{prefix}--syntax-bg: {filled.background};",
-            f"{prefix}--syntax-bg-highlight: {filled.background_highlight};",
-            f"{prefix}--syntax-control: {filled.control_flow};",
-            f"{prefix}--syntax-declaration: {filled.declaration};",
-            f"{prefix}--syntax-import: {filled.import_};",
-            f"{prefix}--syntax-string: {filled.string};",
-            f"{prefix}--syntax-number: {filled.number};",
-            f"{prefix}--syntax-boolean: {filled.boolean};",
-            f"{prefix}--syntax-type: {filled.type_};",
-            f"{prefix}--syntax-function: {filled.function};",
-            f"{prefix}--syntax-variable: {filled.variable};",
-            f"{prefix}--syntax-constant: {filled.constant};",
-            f"{prefix}--syntax-comment: {filled.comment};",
-            f"{prefix}--syntax-docstring: {filled.docstring};",
-            f"{prefix}--syntax-error: {filled.error};",
-            f"{prefix}--syntax-warning: {filled.warning};",
-            f"{prefix}--syntax-added: {filled.added};",
-            f"{prefix}--syntax-removed: {filled.removed};",
-            f"{prefix}--syntax-text: {filled.text};",
-            f"{prefix}--syntax-muted: {filled.muted};",
-            f"{prefix}--syntax-punctuation: {filled.punctuation};",
-            f"{prefix}--syntax-operator: {filled.operator};",
-            f"{prefix}--syntax-attribute: {filled.attribute};",
-            f"{prefix}--syntax-namespace: {filled.namespace};",
-            f"{prefix}--syntax-tag: {filled.tag};",
-            f"{prefix}--syntax-regex: {filled.regex};",
-            f"{prefix}--syntax-escape: {filled.escape};",
-        ]
-        return "\n".join(lines)
+        The unindented block is built once per palette and cached;
+        non-zero indents are derived from it with a single C-level
+        str.replace pass instead of re-formatting every line.
+        """
+        base = self._css_vars
+        if base is None:
+            filled = self.with_defaults()
+            base = "\n".join(
+                f"--syntax-{css}: {getattr(filled, attr)};" for css, attr in _CSS_FIELDS
+            )
+            object.__setattr__(self, "_css_vars", base)
+        if not indent:
+            return base
+        prefix = _INDENT_CACHE.get(indent) or " " * indent
+        return prefix + base.replace("\n", "\n" + prefix)
 
     def generate_css(self, *, class_style: CssClassStyle = "semantic") -> str:
         """Generate complete CSS stylesheet for syntax highlighting.
@@ -372,9 +437,16 @@ class AdaptivePalette:
     dark: SyntaxPalette
 
     def __post_init__(self) -> None:
-        """Validate adaptive palette."""
+        """Validate the adaptive palette and pre-fill both modes.
+
+        Filling light/dark up front means CSS generation never re-runs
+        the default-filling pass: with_defaults() on an already-filled
+        palette is a cached-attribute hit.
+        """
         if not self.name:
             raise ValueError("Palette name is required")
+        object.__setattr__(self, "light", self.light.with_defaults())
+        object.__setattr__(self, "dark", self.dark.with_defaults())
 
     def generate_css(self, *, class_style: CssClassStyle = "semantic") -> str:
         """Generate adaptive CSS with light/dark mode support.
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import operator
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 import pytest
 
 from rosettes import Token, get_lexer, list_languages
+from tests._helpers import read_utf8
 
 if TYPE_CHECKING:
     pass
@@ -16,6 +19,31 @@ if TYPE_CHECKING:
 # Test fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
+# Built once at import; applied to every slow item during collection.
+_SKIP_SLOW = pytest.mark.skip(reason="slow test: pass --runredos to run")
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--runredos",
+        action="store_true",
+        default=False,
+        help="run slow ReDoS/benchmark tests (the 54-language pathological-input grid)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip slow-marked tests by default; opt in with --runredos.
+
+    The ReDoS grid is 54 languages x 4 patterns of deliberately nasty
+    input — worth minutes in a nightly job, not on every local run.
+    """
+    if config.getoption("--runredos"):
+        return
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(_SKIP_SLOW)
+
 
 @pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
@@ -29,33 +57,46 @@ def all_languages() -> list[str]:
     return list_languages()
 
 
-@pytest.fixture
+# Lexers are immutable and stateless across tokenize calls, so one
+# instance per language serves the whole session.
+@pytest.fixture(scope="session")
 def python_lexer():
     """Get Python lexer instance."""
     return get_lexer("python")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def javascript_lexer():
     """Get JavaScript lexer instance."""
     return get_lexer("javascript")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def rust_lexer():
     """Get Rust lexer instance."""
     return get_lexer("rust")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kida_lexer():
     """Get Kida lexer instance."""
     return get_lexer("kida")
 
 
+@pytest.fixture(scope="session")
+def php_lexer():
+    """Get PHP lexer instance."""
+    return get_lexer("php")
+
+
 def load_fixture(language: str, fixture_name: str) -> tuple[str, list[dict]]:
     """Load a test fixture.
 
+    Results are cached for the session: parametrized suites reload the
+    same fixture many times, and this collapses the repeated disk reads
+    and JSON parses to one each. Treat the returned token list as
+    immutable — it is shared across tests.
+
     Args:
         language: Language name (e.g., 'python').
         fixture_name: Fixture name without extension (e.g., 'keywords').
@@ -64,6 +105,12 @@ def load_fixture(language: str, fixture_name: str) -> tuple[str, list[dict]]:
         Tuple of (input_code, expected_tokens) where expected_tokens is a list
         of dicts with 'type', 'value', 'line', 'column' keys.
     """
+    return _load_fixture_cached(language, fixture_name)
+
+
+@functools.cache
+def _load_fixture_cached(language: str, fixture_name: str) -> tuple[str, list[dict]]:
+    """Read and parse a fixture from disk (one time per session)."""
     lang_dir = FIXTURES_DIR / language
     input_file = lang_dir / f"{fixture_name}.{_get_extension(language)}"
     tokens_file = lang_dir / f"{fixture_name}.tokens"
@@ -71,35 +118,35 @@ def load_fixture(language: str, fixture_name: str) -> tuple[str, list[dict]]:
     if not input_file.exists():
         raise FileNotFoundError(f"Fixture input not found: {input_file}")
 
-    input_code = input_file.read_text(encoding="utf-8")
+    input_code = read_utf8(input_file)
 
-    if tokens_file.exists():
-        expected_tokens = json.loads(tokens_file.read_text(encoding="utf-8"))
-    else:
-        # No expected tokens file - return empty list (test will generate)
-        expected_tokens = []
+    # No expected tokens file -> empty list (test will generate)
+    expected_tokens = json.loads(read_utf8(tokens_file)) if tokens_file.exists() else []
 
     return input_code, expected_tokens
 
 
+# Language -> fixture file extension (module-level: built once, not per call)
+_EXTENSIONS: Final[dict[str, str]] = {
+    "python": "py",
+    "javascript": "js",
+    "typescript": "ts",
+    "rust": "rs",
+    "go": "go",
+    "kida": "kida",
+    "html": "html",
+    "css": "css",
+    "yaml": "yml",
+    "json": "json",
+    "bash": "sh",
+    "sql": "sql",
+    "markdown": "md",
+}
+
+
 def _get_extension(language: str) -> str:
     """Get file extension for a language."""
-    extensions = {
-        "python": "py",
-        "javascript": "js",
-        "typescript": "ts",
-        "rust": "rs",
-        "go": "go",
-        "kida": "kida",
-        "html": "html",
-        "css": "css",
-        "yaml": "yml",
-        "json": "json",
-        "bash": "sh",
-        "sql": "sql",
-        "markdown": "md",
-    }
-    return extensions.get(language, "txt")
+    return _EXTENSIONS.get(language, "txt")
 
 
 def tokens_to_dict(tokens: list[Token]) -> list[dict]:
@@ -115,6 +162,17 @@ def tokens_to_dict(tokens: list[Token]) -> list[dict]:
     ]
 
 
+# Bound attrgetter: one C-level call per token instead of four attribute
+# lookups. TokenType is a StrEnum, so the resulting tuples compare equal
+# to ("kw-string", value, line, column) tuples built from fixture dicts.
+_token_fields = operator.attrgetter("type", "value", "line", "column")
+
+
+def tokens_to_tuples(tokens: list[Token]) -> list[tuple]:
+    """Convert Token objects to (type, value, line, column) tuples."""
+    return [_token_fields(token) for token in tokens]
+
+
 def assert_tokens_match(
     actual: list[Token],
     expected: list[dict],
@@ -130,33 +188,41 @@ def assert_tokens_match(
         fuzzy_boundaries: If True, allow ±tolerance character boundary differences.
         tolerance: Character tolerance for fuzzy matching.
     """
-    actual_dicts = tokens_to_dict(actual)
+    actual_tuples = tokens_to_tuples(actual)
+    # Coerce expected dicts once; tuple equality is a single C-level
+    # comparison per token vs. four hashed key lookups for dicts.
+    expected_tuples = [(t["type"], t["value"], t["line"], t["column"]) for t in expected]
 
-    if len(actual_dicts) != len(expected):
+    if len(actual_tuples) != len(expected_tuples):
         # Show first few differences
-        diff_msg = f"Token count mismatch: {len(actual_dicts)} != {len(expected)}\n"
-        diff_msg += f"First 5 actual: {actual_dicts[:5]}\n"
-        diff_msg += f"First 5 expected: {expected[:5]}"
+        diff_msg = f"Token count mismatch: {len(actual_tuples)} != {len(expected_tuples)}\n"
+        diff_msg += f"First 5 actual: {actual_tuples[:5]}\n"
+        diff_msg += f"First 5 expected: {expected_tuples[:5]}"
         raise AssertionError(diff_msg)
 
-    for i, (actual_token, expected_token) in enumerate(zip(actual_dicts, expected, strict=True)):
+    # Happy path: one C-level list comparison. Only walk token-by-token
+    # (for the indexed diagnostics) when something actually differs.
+    if not fuzzy_boundaries and actual_tuples == expected_tuples:
+        return
+
+    for i, (actual_token, expected_token) in enumerate(
+        zip(actual_tuples, expected_tuples, strict=True)
+    ):
         if fuzzy_boundaries:
             # Allow tolerance in column/line positions
-            if actual_token["type"] != expected_token["type"]:
+            if actual_token[0] != expected_token[0]:
                 raise AssertionError(
-                    f"Token {i}: type mismatch: {actual_token['type']} != {expected_token['type']}"
+                    f"Token {i}: type mismatch: {actual_token[0]} != {expected_token[0]}"
                 )
-            if actual_token["value"] != expected_token["value"]:
+            if actual_token[1] != expected_token[1]:
                 raise AssertionError(
-                    f"Token {i}: value mismatch: "
-                    f"{actual_token['value']} != {expected_token['value']}"
+                    f"Token {i}: value mismatch: {actual_token[1]} != {expected_token[1]}"
                 )
             # Check column within tolerance
-            col_diff = abs(actual_token["column"] - expected_token["column"])
+            col_diff = abs(actual_token[3] - expected_token[3])
             if col_diff > tolerance:
                 raise AssertionError(
-                    f"Token {i}: column out of tolerance: "
-                    f"{actual_token['column']} vs {expected_token['column']}"
+                    f"Token {i}: column out of tolerance: {actual_token[3]} vs {expected_token[3]}"
                 )
         else:
             # Strict matching
@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
+import time
+
 import pytest
 
-from rosettes import get_lexer, list_languages
+from rosettes import get_lexer
+
+# Fixed smoke-test subset (was list_languages()[:10]): a static tuple
+# keeps the parametrized IDs stable and spares collection from touching
+# the language registry.
+_SMOKE_LANGUAGES = ("bash", "c", "clojure", "cpp", "css", "csv", "cuda", "cue", "dart", "diff")
 
 
 class TestEmptyInput:
     """Test empty input handling."""
 
-    @pytest.mark.parametrize("language", list_languages()[:10])  # Test first 10 languages
+    @pytest.mark.parametrize("language", _SMOKE_LANGUAGES)
     def test_empty_input(self, language: str) -> None:
         """Empty input should not crash."""
         lexer = get_lexer(language)
@@ -36,8 +43,6 @@ class TestLargeInput:
 
     def test_very_long_line(self) -> None:
         """Very long line should complete in reasonable time."""
-        import time
-
         lexer = get_lexer("python")
         code = "x" * 100_000  # 100K chars
 
@@ -51,8 +56,6 @@ class TestLargeInput:
 
     def test_many_tokens(self) -> None:
         """Many tokens should complete in reasonable time."""
-        import time
-
         lexer = get_lexer("python")
         code = "x " * 50_000  # 100K tokens
 
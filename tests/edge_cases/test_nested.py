@@ -4,20 +4,26 @@ from __future__ import annotations
 
 from rosettes import TokenType, get_lexer
 
+# Lexers are immutable and get_lexer is cached; bind them once so each
+# test skips the alias-resolution call.
+PY = get_lexer("python")
+JS = get_lexer("javascript")
+RUST = get_lexer("rust")
+
 
 class TestNestedStrings:
     """Test nested string constructs."""
 
     def test_nested_f_string(self) -> None:
         """Nested f-strings should tokenize correctly."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = 'f"outer {f"inner"} outer"'
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
 
     def test_template_literal_nested(self) -> None:
         """Nested template literals should tokenize correctly."""
-        lexer = get_lexer("javascript")
+        lexer = JS
         code = "`outer ${`inner`} outer`"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
@@ -28,19 +34,19 @@ class TestNestedComments:
 
     def test_nested_block_comments(self) -> None:
         """Nested block comments should tokenize correctly."""
-        lexer = get_lexer("rust")
+        lexer = RUST
         code = "/* outer /* inner */ still outer */"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
 
     def test_comments_inside_strings(self) -> None:
         """Comments inside strings should NOT tokenize as comment."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = '"not a # comment"'
         tokens = list(lexer.tokenize(code))
-        # Should not have COMMENT_SINGLE token
-        comment_tokens = [t for t in tokens if t.type == TokenType.COMMENT_SINGLE]
-        assert len(comment_tokens) == 0
+        # Should not have COMMENT_SINGLE token (identity check: enum
+        # members are singletons; any() short-circuits on first hit)
+        assert not any(t.type is TokenType.COMMENT_SINGLE for t in tokens)
 
 
 class TestNestedConstructs:
@@ -48,14 +54,14 @@ class TestNestedConstructs:
 
     def test_nested_parentheses(self) -> None:
         """Deeply nested parentheses should tokenize correctly."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = "((((((x))))))"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
 
     def test_nested_brackets(self) -> None:
         """Nested brackets should tokenize correctly."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = "[[[[[x]]]]]"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
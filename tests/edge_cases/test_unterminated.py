@@ -6,6 +6,14 @@ import pytest
 
 from rosettes import TokenType, get_lexer
 
+from .._helpers import tokenize_cached
+
+# Lexers are immutable and get_lexer is cached; bind the single-language
+# ones once so each test skips the alias-resolution call.
+PY = get_lexer("python")
+JS = get_lexer("javascript")
+RUST = get_lexer("rust")
+
 
 class TestUnterminatedStrings:
     """Test handling of unterminated strings."""
@@ -13,14 +21,13 @@ class TestUnterminatedStrings:
     @pytest.mark.parametrize("language", ["python", "javascript", "rust", "go"])
     def test_unterminated_string_at_eof(self, language: str) -> None:
         """Unterminated string at EOF should not hang or crash."""
-        lexer = get_lexer(language)
         code = '"hello'
 
         # Should not hang or raise exception
-        tokens = list(lexer.tokenize(code))
+        tokens = tokenize_cached(language, code)
         assert len(tokens) > 0
         # Should emit STRING or ERROR token
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert (
             TokenType.STRING in types
             or TokenType.STRING_DOUBLE in types
@@ -30,14 +37,14 @@ class TestUnterminatedStrings:
 
     def test_unterminated_single_quote(self) -> None:
         """Unterminated single quote should be handled."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = "'hello"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
 
     def test_unterminated_triple_quote(self) -> None:
         """Unterminated triple quote should be handled."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = '"""hello'
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
@@ -48,18 +55,18 @@ class TestUnterminatedComments:
 
     def test_unterminated_block_comment(self) -> None:
         """Unterminated block comment should not hang."""
-        lexer = get_lexer("javascript")
+        lexer = JS
         code = "/* hello"
 
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
         # Should emit COMMENT_MULTILINE or handle gracefully
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.COMMENT_MULTILINE in types or TokenType.ERROR in types
 
     def test_unterminated_nested_comment(self) -> None:
         """Unterminated nested comment should not hang."""
-        lexer = get_lexer("rust")
+        lexer = RUST
         code = "/* outer /* inner"
 
         tokens = list(lexer.tokenize(code))
@@ -71,14 +78,14 @@ class TestUnterminatedConstructs:
 
     def test_unterminated_template_literal(self) -> None:
         """Unterminated template literal should be handled."""
-        lexer = get_lexer("javascript")
+        lexer = JS
         code = "`hello ${"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
 
     def test_unterminated_f_string(self) -> None:
         """Unterminated f-string should be handled."""
-        lexer = get_lexer("python")
+        lexer = PY
         code = 'f"hello {'
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
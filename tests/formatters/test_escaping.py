@@ -6,6 +6,8 @@ import pytest
 
 from rosettes import highlight
 
+from .._helpers import strip_wrappers
+
 
 class TestHtmlEscaping:
     """Test HTML special character escaping."""
@@ -51,16 +53,7 @@ class TestXssPrevention:
         for code, lang in xss_vectors:
             html = highlight(code, lang)
             # No unescaped angle brackets except our own wrapper tags
-            html_content = (
-                html.replace("<pre", "")
-                .replace("<code", "")
-                .replace("<div", "")
-                .replace("<span", "")
-                .replace("</pre>", "")
-                .replace("</code>", "")
-                .replace("</div>", "")
-                .replace("</span>", "")
-            )
+            html_content = strip_wrappers(html)
             assert "<script>" not in html_content
             assert "onerror=" not in html_content
             assert "onload=" not in html_content
@@ -108,16 +101,7 @@ class TestComprehensiveXssVectors:
         """All XSS vectors must be neutralized."""
         html = highlight(code, language)
         # Remove our own wrapper tags
-        html_content = (
-            html.replace("<pre", "")
-            .replace("<code", "")
-            .replace("<div", "")
-            .replace("<span", "")
-            .replace("</pre>", "")
-            .replace("</code>", "")
-            .replace("</div>", "")
-            .replace("</span>", "")
-        )
+        html_content = strip_wrappers(html)
         # Should not contain unescaped dangerous patterns
         assert "<script>" not in html_content
         assert "onerror=" not in html_content
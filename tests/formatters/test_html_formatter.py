@@ -66,6 +66,26 @@ class TestHtmlFormatterLineHighlighting:
         # Should not crash, may or may not highlight
         assert isinstance(html, str)
 
+    def test_line_highlighting_negative(self) -> None:
+        """Negative line numbers can never match and highlight nothing."""
+        code = "line1\nline2"
+        html = highlight(code, "python", hl_lines={-3})
+        assert 'class="hll"' not in html
+
+    def test_line_highlighting_huge_line_number(self) -> None:
+        """A hostile line number must not drive a huge mask allocation."""
+        code = "line1\nline2"
+        html = highlight(code, "python", hl_lines={2, 10**9})
+        # Valid entries still highlight; the huge one is simply unmatched
+        assert html.count('class="hll"') == 1
+
+    def test_line_highlighting_past_mask_cap(self) -> None:
+        """Lines beyond the mask cap still highlight via the set probe."""
+        line_no = 70_000  # past _HL_MASK_MAX_LINE (64k)
+        code = "x\n" * line_no
+        html = highlight(code, "python", hl_lines={line_no})
+        assert html.count('class="hll"') == 1
+
 
 class TestHtmlFormatterLineNumbers:
     """Test line number functionality."""
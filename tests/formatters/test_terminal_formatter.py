@@ -1,6 +1,22 @@
+import os
+import re
+import time
+
+import pytest
+
 from rosettes import highlight
 from rosettes.formatters.terminal import TerminalFormatter
 
+# One compiled pass collects every colored span as (sgr-code, text),
+# replacing repeated substring scans over the output. If the formatter
+# ever merges SGR codes (\033[47;30m style), split group 1 on ";".
+_SGR_RE = re.compile(r"\x1b\[(\d+)m([^\x1b]*)\x1b\[0m")
+
+
+def _colored_spans(output: str) -> set[tuple[str, str]]:
+    """Extract {(sgr_code, text)} pairs from ANSI output."""
+    return {(m.group(1), m.group(2)) for m in _SGR_RE.finditer(output)}
+
 
 def test_terminal_highlight():
     code = "def foo(): pass"
@@ -13,8 +29,9 @@ def test_terminal_highlight():
     # Check for specific colors
     # def = DECLARATION = \033[36m
     # pass = CONTROL_FLOW = \033[35m
-    assert "\033[36mdef\033[0m" in output
-    assert "\033[35mpass\033[0m" in output
+    spans = _colored_spans(output)
+    assert ("36", "def") in spans
+    assert ("35", "pass") in spans
 
 
 def test_terminal_formatter_direct():
@@ -28,9 +45,10 @@ def test_terminal_formatter_direct():
     # x = VARIABLE (\033[37m)
     # = = OPERATOR (\033[37m)
     # 1 = NUMBER (\033[33m)
-    assert "\033[37mx\033[0m" in output
-    assert "\033[37m=\033[0m" in output
-    assert "\033[33m1\033[0m" in output
+    spans = _colored_spans(output)
+    assert ("37", "x") in spans
+    assert ("37", "=") in spans
+    assert ("33", "1") in spans
 
 
 def test_terminal_highlight_many():
@@ -45,3 +63,34 @@ def test_terminal_highlight_many():
     assert len(results) == 2
     assert "\033[" in results[0]
     assert "\033[" in results[1]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(os.environ.get("BENCH") != "1", reason="set BENCH=1 to run benchmarks")
+def test_highlight_many_is_batched():
+    """highlight_many must beat a sequential highlight loop.
+
+    Guards the batched path against regressing to tuple-at-a-time:
+    on free-threaded builds the thread pool should give real speedup
+    over a per-block Python loop. Timing-based, so opt-in via BENCH=1
+    (GIL builds serialize the workers and the margin disappears).
+    """
+    from rosettes import highlight_many
+
+    blocks = [
+        ("def foo(x):\n    return x + 1\n", "python"),
+        ("const add = (a, b) => a + b;\n", "javascript"),
+    ] * 500
+
+    start = time.perf_counter()
+    batched = highlight_many(blocks, formatter="terminal")
+    batched_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    looped = [highlight(code, lang, formatter="terminal") for code, lang in blocks]
+    loop_time = time.perf_counter() - start
+
+    assert batched == looped
+    assert batched_time <= loop_time * 0.8, (
+        f"highlight_many ({batched_time:.3f}s) not faster than sequential loop ({loop_time:.3f}s)"
+    )
@@ -0,0 +1,28 @@
+"""Shared fixture-source extension table for lexer tests.
+
+Single source of truth for the extensions that fixture source files
+may carry, previously duplicated between conftest.py and
+test_fixtures.py. Order doubles as match priority when one fixture
+stem has several source files.
+"""
+
+from __future__ import annotations
+
+# Keep the grid layout; one entry per line would be 57 lines.
+# fmt: off
+EXTENSIONS: tuple[str, ...] = (
+    ".py", ".js", ".ts", ".rs", ".go", ".java", ".kt", ".swift",
+    ".rb", ".pl", ".lua", ".scala", ".ex", ".hs", ".nim", ".zig",
+    ".v", ".dart", ".gleam", ".yaml", ".json", ".php", ".sh",
+    ".sql", ".toml", ".xml", ".html", ".css", ".md", ".kida",
+    ".c", ".cpp", ".h", ".hpp", ".dockerfile", ".graphql", ".tf",
+    ".groovy", ".r", ".jl", ".ini", ".csv", ".diff", ".makefile",
+    ".nginx", ".proto", ".mojo", ".triton", ".cu", ".stan", ".pkl",
+    ".cue", ".clj", ".jinja", ".tree", ".ps1", ".txt",
+)
+# fmt: on
+
+# extension -> match priority (lower wins)
+EXT_PRIORITY: dict[str, int] = {ext: i for i, ext in enumerate(EXTENSIONS)}
+
+TOKENS_SUFFIX = ".tokens.json"
@@ -2,13 +2,19 @@
 
 from __future__ import annotations
 
+import functools
 import json
+import os
 from pathlib import Path
 
 import pytest
 
 from rosettes import get_lexer
 
+from .._helpers import read_utf8
+from ._ext import EXT_PRIORITY as _EXT_PRIORITY
+from ._ext import TOKENS_SUFFIX as _TOKENS_SUFFIX
+
 # High-priority languages from RFC
 HIGH_PRIORITY_LANGUAGES = [
     "kida",
@@ -32,17 +38,6 @@ HIGH_PRIORITY_LANGUAGES = [
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
-# Extension mapping for finding source files
-EXTENSIONS = [
-    ".py", ".js", ".ts", ".rs", ".go", ".java", ".kt", ".swift", ".rb", ".pl",
-    ".lua", ".scala", ".ex", ".hs", ".nim", ".zig", ".v", ".dart", ".gleam",
-    ".yaml", ".json", ".php", ".sh", ".sql", ".toml", ".xml", ".html", ".css",
-    ".md", ".kida", ".c", ".cpp", ".h", ".hpp", ".dockerfile", ".graphql", ".tf",
-    ".groovy", ".r", ".jl", ".ini", ".csv", ".diff", ".makefile", ".nginx",
-    ".proto", ".mojo", ".triton", ".cu", ".stan", ".pkl", ".cue", ".clj",
-    ".jinja", ".tree", ".ps1", ".txt"
-]
-
 
 @pytest.fixture
 def lexer(request):
@@ -51,35 +46,57 @@ def lexer(request):
     return get_lexer(language)
 
 
+@functools.cache
+def _source_files(language: str) -> dict[str, str]:
+    """Map fixture stems to source paths with one scan per language.
+
+    Replaces the per-fixture loop that probed every known extension
+    with exists() — one scandir pass instead of ~60 stat calls per
+    lookup. When a stem has several source files the EXTENSIONS
+    ordering decides, matching the old probe order.
+    """
+    lang_dir = FIXTURES_DIR / language
+    sources: dict[str, str] = {}
+    if not lang_dir.is_dir():
+        return sources
+    for entry in os.scandir(lang_dir):
+        if entry.name.endswith(_TOKENS_SUFFIX):
+            continue
+        dot = entry.name.rfind(".")
+        if dot <= 0:
+            continue
+        stem, ext = entry.name[:dot], entry.name[dot:]
+        priority = _EXT_PRIORITY.get(ext)
+        if priority is None:
+            continue
+        prev = sources.get(stem)
+        if prev is None or priority < _EXT_PRIORITY[prev[prev.rfind(".") :]]:
+            sources[stem] = entry.path
+    return sources
+
+
 @pytest.fixture
 def load_fixture():
     """Load fixture source and expected tokens.
-    
+
     Usage:
         def test_something(load_fixture):
             code, expected_tokens = load_fixture("python", "keywords")
     """
     def _load(language: str, name: str) -> tuple[str, list[dict]]:
         lang_dir = FIXTURES_DIR / language
-        
-        # Find source file (try common extensions)
-        source_file = None
-        for ext in EXTENSIONS:
-            candidate = lang_dir / f"{name}{ext}"
-            if candidate.exists():
-                source_file = candidate
-                break
-        
+
+        source_file = _source_files(language).get(name)
         if source_file is None:
             pytest.skip(f"Fixture {name} not found for {language}")
-        
-        tokens_file = lang_dir / f"{name}.tokens.json"
+
+        tokens_file = lang_dir / f"{name}{_TOKENS_SUFFIX}"
         if not tokens_file.exists():
             pytest.skip(f"Tokens file not found: {tokens_file}")
-        
-        code = source_file.read_text(encoding="utf-8")
-        expected_tokens = json.loads(tokens_file.read_text(encoding="utf-8"))
-        
+
+        code = read_utf8(source_file)
+        expected_tokens = json.loads(read_utf8(tokens_file))
+
         return code, expected_tokens
-    
+
     return _load
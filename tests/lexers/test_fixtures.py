@@ -6,73 +6,134 @@ Complements language-specific tests in test_*_sm.py files.
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+from operator import attrgetter
 from pathlib import Path
 
 import pytest
 
-from rosettes import get_lexer
+from rosettes import TokenType, get_lexer
+
+from .._helpers import read_utf8
+from ._ext import EXT_PRIORITY as _EXT_PRIORITY
+from ._ext import TOKENS_SUFFIX as _TOKENS_SUFFIX
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
+_get_value = attrgetter("value")
+
+# Resolve expected type names to enum members once; the per-token check
+# becomes a dict probe plus an identity compare instead of an attribute
+# walk and string comparison. get() maps unknown names to None, which
+# never matches, so bad fixture data still fails with the full message.
+_NAME2TYPE = {t.name: t for t in TokenType}
+
 
 def discover_fixtures():
     """Discover all fixture pairs (source + tokens).
-    
+
+    One os.scandir pass per language directory: sources are indexed by
+    stem and joined against the tokens files, instead of probing every
+    known extension with exists() for every fixture (an O(fixtures ×
+    extensions) stat storm that dominated collection).
+
     Returns:
         List of tuples: (language, fixture_name, source_file, tokens_file)
     """
     fixtures = []
     if not FIXTURES_DIR.exists():
         return fixtures
-    
+
     for lang_dir in sorted(FIXTURES_DIR.iterdir()):
         if not lang_dir.is_dir():
             continue
         language = lang_dir.name
-        
-        for tokens_file in sorted(lang_dir.glob("*.tokens.json")):
-            name = tokens_file.stem.replace(".tokens", "")
-            
-            # Find corresponding source file (try common extensions)
-            source_file = None
-            for ext in [
-                ".py", ".js", ".ts", ".rs", ".go", ".java", ".kt", ".swift",
-                ".rb", ".pl", ".lua", ".scala", ".ex", ".hs", ".nim", ".zig",
-                ".v", ".dart", ".gleam", ".yaml", ".json", ".php", ".sh",
-                ".sql", ".toml", ".xml", ".html", ".css", ".md", ".kida",
-                ".c", ".cpp", ".h", ".hpp", ".dockerfile", ".graphql", ".tf",
-                ".groovy", ".r", ".jl", ".ini", ".csv", ".diff", ".makefile",
-                ".nginx", ".proto", ".mojo", ".triton", ".cu", ".stan", ".pkl",
-                ".cue", ".clj", ".jinja", ".tree", ".ps1", ".txt"
-            ]:
-                candidate = lang_dir / f"{name}{ext}"
-                if candidate.exists():
-                    source_file = candidate
-                    break
-            
-            if source_file:
-                fixtures.append((language, name, source_file, tokens_file))
-    
+
+        sources: dict[str, str] = {}
+        tokens_names: list[str] = []
+        for entry in os.scandir(lang_dir):
+            if entry.name.endswith(_TOKENS_SUFFIX):
+                tokens_names.append(entry.name)
+                continue
+            dot = entry.name.rfind(".")
+            if dot <= 0:
+                continue
+            stem, ext = entry.name[:dot], entry.name[dot:]
+            priority = _EXT_PRIORITY.get(ext)
+            if priority is None:
+                continue
+            prev = sources.get(stem)
+            if prev is None or priority < _EXT_PRIORITY[prev[prev.rfind(".") :]]:
+                sources[stem] = entry.name
+
+        for tokens_name in sorted(tokens_names):
+            name = tokens_name[: -len(_TOKENS_SUFFIX)]
+            source_name = sources.get(name)
+            if source_name:
+                # Group by language so pytest-xdist (-n auto --dist
+                # loadgroup) keeps one language's fixtures on one
+                # worker, sharing the cached lexer and file reads.
+                fixtures.append(
+                    pytest.param(
+                        language,
+                        name,
+                        lang_dir / source_name,
+                        lang_dir / tokens_name,
+                        marks=pytest.mark.xdist_group(name=language),
+                    )
+                )
+
     return fixtures
 
 
-FIXTURES = discover_fixtures()
+# Discovery is deferred to pytest_generate_tests so runs that never
+# select these tests (and --collect-only on other paths) skip the
+# fixture-directory walk entirely. The sentinel caches the one walk.
+_FIXTURES: list | None = None
+
+
+def pytest_generate_tests(metafunc):
+    if {"language", "name", "source_file", "tokens_file"} <= set(metafunc.fixturenames):
+        global _FIXTURES
+        if _FIXTURES is None:
+            _FIXTURES = discover_fixtures()
+        metafunc.parametrize("language,name,source_file,tokens_file", _FIXTURES)
+
+
+# Both fixture tests read the same files per (language, name) pair;
+# cache the reads and JSON parses so each happens once per session.
+# Cached values are shared — treat them as immutable.
+@functools.cache
+def _load_source(path: Path) -> str:
+    return read_utf8(path)
+
+
+@functools.cache
+def _load_tokens(path: Path) -> list[dict]:
+    return json.loads(read_utf8(path))
+
+
+@functools.cache
+def _tokenize(language: str, source_file: Path) -> tuple:
+    """Tokenize a fixture source once for both invariant tests.
+
+    The type-check and reconstruction tests lex the same source;
+    caching halves the lexing work while keeping the two assertions as
+    separate test IDs. Tokens are immutable, so sharing is safe.
+    """
+    return tuple(get_lexer(language).tokenize(_load_source(source_file)))
 
 
-@pytest.mark.parametrize("language,name,source_file,tokens_file", FIXTURES)
 def test_fixture_token_types(language, name, source_file, tokens_file):
     """Verify token types match expected fixture."""
-    lexer = get_lexer(language)
-    source = source_file.read_text(encoding="utf-8")
-    
     try:
-        expected_json = tokens_file.read_text(encoding="utf-8")
-        expected = json.loads(expected_json)
+        expected = _load_tokens(tokens_file)
     except json.JSONDecodeError as e:
         pytest.fail(f"Invalid JSON in {tokens_file}: {e}")
-    
-    actual = list(lexer.tokenize(source))
+
+    actual = _tokenize(language, source_file)
     
     # First verify count matches
     assert len(actual) == len(expected), (
@@ -82,9 +143,14 @@ def test_fixture_token_types(language, name, source_file, tokens_file):
         f"Tokens: {tokens_file}"
     )
     
+    # Fixture authors include positions for every token or for none, so
+    # decide once here instead of probing each dict inside the loop.
+    check_line = bool(expected) and "line" in expected[0]
+    check_column = bool(expected) and "column" in expected[0]
+
     # Then verify each token
     for i, (act, exp) in enumerate(zip(actual, expected)):
-        assert act.type.name == exp["type"], (
+        assert act.type is _NAME2TYPE.get(exp["type"]), (
             f"Token {i} type mismatch in {language}/{name}: "
             f"got {act.type.name}, expected {exp['type']} "
             f"for value {act.value!r} at line {act.line}, column {act.column}"
@@ -95,26 +161,26 @@ def test_fixture_token_types(language, name, source_file, tokens_file):
             f"at line {act.line}, column {act.column}"
         )
         # Optionally verify line/column if present in expected
-        if "line" in exp:
+        if check_line:
             assert act.line == exp["line"], (
                 f"Token {i} line mismatch in {language}/{name}: "
                 f"got {act.line}, expected {exp['line']}"
             )
-        if "column" in exp:
+        if check_column:
             assert act.column == exp["column"], (
                 f"Token {i} column mismatch in {language}/{name}: "
                 f"got {act.column}, expected {exp['column']}"
             )
 
 
-@pytest.mark.parametrize("language,name,source_file,tokens_file", FIXTURES)
 def test_fixture_reconstructs(language, name, source_file, tokens_file):
     """Verify tokenization reconstructs original source (invariant check)."""
-    lexer = get_lexer(language)
-    source = source_file.read_text(encoding="utf-8")
-    
-    tokens = list(lexer.tokenize(source))
-    reconstructed = "".join(t.value for t in tokens)
+    source = _load_source(source_file)
+
+    tokens = _tokenize(language, source_file)
+    # map + attrgetter keeps the per-token attribute fetch in C instead
+    # of a generator frame, and hands join a sized iterable.
+    reconstructed = "".join(map(_get_value, tokens))
     
     assert reconstructed == source, (
         f"Reconstruction failed for {language}/{name}: "
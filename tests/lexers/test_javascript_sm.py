@@ -53,15 +53,13 @@ class TestJavaScriptStrings:
         """Single-quoted strings should be STRING."""
         code = "'hello'"
         tokens = list(javascript_lexer.tokenize(code))
-        string_tokens = [t for t in tokens if t.type == TokenType.STRING]
-        assert len(string_tokens) > 0
+        assert any(t.type is TokenType.STRING for t in tokens)
 
     def test_double_quoted_string(self, javascript_lexer) -> None:
         """Double-quoted strings should be STRING."""
         code = '"hello"'
         tokens = list(javascript_lexer.tokenize(code))
-        string_tokens = [t for t in tokens if t.type == TokenType.STRING]
-        assert len(string_tokens) > 0
+        assert any(t.type is TokenType.STRING for t in tokens)
 
     def test_template_literal(self, javascript_lexer) -> None:
         """Template literals should be tokenized."""
@@ -75,10 +73,10 @@ class TestJavaScriptStrings:
         code = '"\\n\\t\\r"'
         tokens = list(javascript_lexer.tokenize(code))
         # Escape sequences are part of the string token, not separate tokens
-        string_tokens = [t for t in tokens if t.type == TokenType.STRING]
-        assert len(string_tokens) > 0
+        string_token = next((t for t in tokens if t.type is TokenType.STRING), None)
+        assert string_token is not None
         # Verify escape sequences are in the string value
-        assert "\\n" in string_tokens[0].value or "\n" in string_tokens[0].value
+        assert "\\n" in string_token.value or "\n" in string_token.value
 
 
 class TestJavaScriptNumbers:
@@ -112,35 +110,29 @@ class TestJavaScriptComments:
         """Line comments should be COMMENT_SINGLE."""
         code = "// This is a comment"
         tokens = list(javascript_lexer.tokenize(code))
-        comment_tokens = [t for t in tokens if t.type == TokenType.COMMENT_SINGLE]
-        assert len(comment_tokens) > 0
+        assert any(t.type is TokenType.COMMENT_SINGLE for t in tokens)
 
     def test_block_comment(self, javascript_lexer) -> None:
         """Block comments should be COMMENT_MULTILINE."""
         code = "/* This is a comment */"
         tokens = list(javascript_lexer.tokenize(code))
-        comment_tokens = [t for t in tokens if t.type == TokenType.COMMENT_MULTILINE]
-        assert len(comment_tokens) > 0
+        assert any(t.type is TokenType.COMMENT_MULTILINE for t in tokens)
 
 
 class TestJavaScriptOperators:
     """Test JavaScript operator tokenization."""
 
-    def test_arithmetic_operators(self, javascript_lexer) -> None:
+    @pytest.mark.parametrize("op", ["+", "-", "*", "/", "%", "**"])
+    def test_arithmetic_operator(self, javascript_lexer, op: str) -> None:
         """Arithmetic operators should be OPERATOR."""
-        operators = ["+", "-", "*", "/", "%", "**"]
-        for op in operators:
-            tokens = list(javascript_lexer.tokenize(op))
-            op_tokens = [t for t in tokens if t.type == TokenType.OPERATOR]
-            assert len(op_tokens) > 0
+        tokens = list(javascript_lexer.tokenize(op))
+        assert any(t.type is TokenType.OPERATOR for t in tokens)
 
-    def test_comparison_operators(self, javascript_lexer) -> None:
+    @pytest.mark.parametrize("op", ["==", "===", "!=", "!==", "<", ">", "<=", ">="])
+    def test_comparison_operator(self, javascript_lexer, op: str) -> None:
         """Comparison operators should be OPERATOR."""
-        operators = ["==", "===", "!=", "!==", "<", ">", "<=", ">="]
-        for op in operators:
-            tokens = list(javascript_lexer.tokenize(op))
-            op_tokens = [t for t in tokens if t.type == TokenType.OPERATOR]
-            assert len(op_tokens) > 0
+        tokens = list(javascript_lexer.tokenize(op))
+        assert any(t.type is TokenType.OPERATOR for t in tokens)
 
 
 class TestJavaScriptComplex:
@@ -150,7 +142,7 @@ class TestJavaScriptComplex:
         """Arrow functions should tokenize correctly."""
         code = "const foo = (x) => x + 1"
         tokens = list(javascript_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD_DECLARATION in types  # const
         assert TokenType.OPERATOR in types  # =>, +
 
@@ -158,14 +150,14 @@ class TestJavaScriptComplex:
         """Destructuring should tokenize correctly."""
         code = "const {x, y} = obj"
         tokens = list(javascript_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD_DECLARATION in types  # const
 
     def test_function_declaration(self, javascript_lexer) -> None:
         """Function declarations should tokenize correctly."""
         code = "function hello(name) { return `Hello, ${name}`; }"
         tokens = list(javascript_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD in types  # function, return
 
 
@@ -27,8 +27,7 @@ class TestKidaComments:
         """Comments should be COMMENT_MULTILINE."""
         code = "{# This is a comment #}"
         tokens = list(kida_lexer.tokenize(code))
-        comment_tokens = [t for t in tokens if t.type == TokenType.COMMENT_MULTILINE]
-        assert len(comment_tokens) > 0
+        assert any(t.type is TokenType.COMMENT_MULTILINE for t in tokens)
 
 
 class TestKidaExpressions:
@@ -39,7 +38,7 @@ class TestKidaExpressions:
         code = "{{ variable }}"
         tokens = list(kida_lexer.tokenize(code))
         # Should have punctuation markers and variable name
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.PUNCTUATION_MARKER in types or TokenType.PUNCTUATION in types
 
     def test_expression_with_filter(self, kida_lexer) -> None:
@@ -56,14 +55,14 @@ class TestKidaStatements:
         """If statements should tokenize correctly."""
         code = "{% if condition %}content{% end %}"
         tokens = list(kida_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD in types  # if, end
 
     def test_for_statement(self, kida_lexer) -> None:
         """For statements should tokenize correctly."""
         code = "{% for item in items %}content{% end %}"
         tokens = list(kida_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD in types  # for, in, end
 
 
@@ -74,9 +73,8 @@ class TestKidaPipelineOperator:
         """Pipeline operator |> should be OPERATOR."""
         code = "{{ value |> upper |> trim }}"
         tokens = list(kida_lexer.tokenize(code))
-        operators = [t for t in tokens if t.value == "|>"]
-        assert len(operators) == 2
-        assert all(t.type == TokenType.OPERATOR for t in operators)
+        assert sum(1 for t in tokens if t.value == "|>") == 2
+        assert all(t.type is TokenType.OPERATOR for t in tokens if t.value == "|>")
 
 
 class TestKidaNullCoalescing:
@@ -86,9 +84,8 @@ class TestKidaNullCoalescing:
         """Null-coalescing operator ?? should be OPERATOR."""
         code = "{{ value ?? 'default' }}"
         tokens = list(kida_lexer.tokenize(code))
-        null_coalesce = [t for t in tokens if t.value == "??"]
-        assert len(null_coalesce) == 1
-        assert null_coalesce[0].type == TokenType.OPERATOR
+        assert sum(1 for t in tokens if t.value == "??") == 1
+        assert next(t for t in tokens if t.value == "??").type is TokenType.OPERATOR
 
 
 class TestKidaUnifiedEnd:
@@ -98,8 +95,7 @@ class TestKidaUnifiedEnd:
         """'end' should be KEYWORD (not endif, endfor, etc.)."""
         code = "{% if x %}content{% end %}"
         tokens = list(kida_lexer.tokenize(code))
-        keywords = [t for t in tokens if t.type == TokenType.KEYWORD]
-        keyword_values = [t.value for t in keywords]
+        keyword_values = [t.value for t in tokens if t.type is TokenType.KEYWORD]
         assert "if" in keyword_values
         assert "end" in keyword_values
         # Should NOT have endif, endfor, etc.
@@ -114,7 +110,7 @@ class TestKidaLetBindings:
         """Let bindings should tokenize correctly."""
         code = "{% let x = 1 %}"
         tokens = list(kida_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD in types  # let
         assert TokenType.NAME_VARIABLE in types  # x
 
@@ -126,7 +122,7 @@ class TestKidaPatternMatching:
         """Match/case statements should tokenize correctly."""
         code = "{% match x %}{% case 1 %}one{% case 2 %}two{% end %}"
         tokens = list(kida_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD in types  # match, case, end
 
 
@@ -138,14 +134,14 @@ class TestKidaBuiltins:
         code = "{{ x | slugify }}"
         tokens = list(kida_lexer.tokenize(code))
         # Should have function name
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.NAME_FUNCTION in types or TokenType.NAME_BUILTIN in types
 
     def test_builtin_test(self, kida_lexer) -> None:
         """Built-in tests should be NAME_BUILTIN."""
         code = "{% if x is defined %}"
         tokens = list(kida_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.NAME_BUILTIN in types or TokenType.KEYWORD in types
 
 
@@ -156,15 +152,14 @@ class TestKidaComplex:
         """Nested statements should tokenize correctly."""
         code = "{% if x %}{% for item in items %}{{ item }}{% end %}{% end %}"
         tokens = list(kida_lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.KEYWORD in types  # if, for, in, end
 
     def test_pipeline_with_filters(self, kida_lexer) -> None:
         """Pipeline with multiple filters should tokenize correctly."""
         code = "{{ value |> upper |> trim |> slugify }}"
         tokens = list(kida_lexer.tokenize(code))
-        operators = [t for t in tokens if t.value == "|>"]
-        assert len(operators) == 3
+        assert sum(1 for t in tokens if t.value == "|>") == 3
 
 
 class TestKidaFixtures:
@@ -16,47 +16,32 @@ from __future__ import annotations
 import pytest
 
 from rosettes import TokenType
+from tests._helpers import missing_types
 from tests.conftest import assert_tokens_match, load_fixture
 
 
 class TestPythonKeywords:
     """Test Python keyword tokenization."""
 
-    def test_def_keyword(self, python_lexer) -> None:
-        """'def' should be tokenized as KEYWORD_DECLARATION."""
-        tokens = list(python_lexer.tokenize("def"))
-        assert len(tokens) == 1
-        assert tokens[0].type == TokenType.KEYWORD_DECLARATION
-        assert tokens[0].value == "def"
-
-    def test_class_keyword(self, python_lexer) -> None:
-        """'class' should be tokenized as KEYWORD_DECLARATION."""
-        tokens = list(python_lexer.tokenize("class"))
-        assert len(tokens) == 1
-        assert tokens[0].type == TokenType.KEYWORD_DECLARATION
-        assert tokens[0].value == "class"
-
-    def test_if_keyword(self, python_lexer) -> None:
-        """'if' should be tokenized as KEYWORD."""
-        tokens = list(python_lexer.tokenize("if"))
+    @pytest.mark.parametrize(
+        "text,expected_type",
+        [
+            ("def", TokenType.KEYWORD_DECLARATION),
+            ("class", TokenType.KEYWORD_DECLARATION),
+            ("if", TokenType.KEYWORD),
+            ("True", TokenType.KEYWORD_CONSTANT),
+            ("False", TokenType.KEYWORD_CONSTANT),
+            ("None", TokenType.KEYWORD_CONSTANT),
+            ("import", TokenType.KEYWORD_NAMESPACE),
+            ("from", TokenType.KEYWORD_NAMESPACE),
+        ],
+    )
+    def test_keyword(self, python_lexer, text: str, expected_type: TokenType) -> None:
+        """Keywords should map to their expected token type."""
+        tokens = list(python_lexer.tokenize(text))
         assert len(tokens) == 1
-        assert tokens[0].type == TokenType.KEYWORD
-        assert tokens[0].value == "if"
-
-    def test_true_false_none(self, python_lexer) -> None:
-        """True, False, None should be KEYWORD_CONSTANT."""
-        for value in ["True", "False", "None"]:
-            tokens = list(python_lexer.tokenize(value))
-            assert tokens[0].type == TokenType.KEYWORD_CONSTANT
-            assert tokens[0].value == value
-
-    def test_import_from(self, python_lexer) -> None:
-        """'import' and 'from' should be KEYWORD_NAMESPACE."""
-        tokens = list(python_lexer.tokenize("import"))
-        assert tokens[0].type == TokenType.KEYWORD_NAMESPACE
-
-        tokens = list(python_lexer.tokenize("from"))
-        assert tokens[0].type == TokenType.KEYWORD_NAMESPACE
+        assert tokens[0].type is expected_type
+        assert tokens[0].value == text
 
 
 class TestPythonStrings:
@@ -67,29 +52,26 @@ class TestPythonStrings:
         code = "'hello'"
         tokens = list(python_lexer.tokenize(code))
         assert len(tokens) >= 1
-        string_tokens = [t for t in tokens if t.type == TokenType.STRING]
-        assert len(string_tokens) > 0
+        assert any(t.type is TokenType.STRING for t in tokens)
 
     def test_double_quoted_string(self, python_lexer) -> None:
         """Double-quoted strings should be STRING."""
         code = '"hello"'
         tokens = list(python_lexer.tokenize(code))
-        string_tokens = [t for t in tokens if t.type == TokenType.STRING]
-        assert len(string_tokens) > 0
+        assert any(t.type is TokenType.STRING for t in tokens)
 
     def test_triple_quoted_string(self, python_lexer) -> None:
         """Triple-quoted strings should be STRING_DOC."""
         code = '"""docstring"""'
         tokens = list(python_lexer.tokenize(code))
-        doc_tokens = [t for t in tokens if t.type == TokenType.STRING_DOC]
-        assert len(doc_tokens) > 0
+        assert any(t.type is TokenType.STRING_DOC for t in tokens)
 
     def test_f_string(self, python_lexer) -> None:
         """f-strings should be tokenized correctly."""
         code = 'f"value: {x}"'
         tokens = list(python_lexer.tokenize(code))
         # Should have string token and interpolation
-        string_types = [t.type for t in tokens]
+        string_types = {t.type for t in tokens}
         assert TokenType.STRING in string_types or TokenType.STRING_DOUBLE in string_types
 
     def test_raw_string(self, python_lexer) -> None:
@@ -103,10 +85,10 @@ class TestPythonStrings:
         code = '"\\n\\t\\r"'
         tokens = list(python_lexer.tokenize(code))
         # Escape sequences are part of the string token, not separate tokens
-        string_tokens = [t for t in tokens if t.type == TokenType.STRING]
-        assert len(string_tokens) > 0
+        string_token = next((t for t in tokens if t.type is TokenType.STRING), None)
+        assert string_token is not None
         # Verify escape sequences are in the string value
-        assert "\\n" in string_tokens[0].value or "\n" in string_tokens[0].value
+        assert "\\n" in string_token.value or "\n" in string_token.value
 
 
 class TestPythonNumbers:
@@ -147,15 +129,13 @@ class TestPythonComments:
         """Line comments should be COMMENT_SINGLE."""
         code = "# This is a comment"
         tokens = list(python_lexer.tokenize(code))
-        comment_tokens = [t for t in tokens if t.type == TokenType.COMMENT_SINGLE]
-        assert len(comment_tokens) > 0
+        assert any(t.type is TokenType.COMMENT_SINGLE for t in tokens)
 
     def test_docstring(self, python_lexer) -> None:
         """Docstrings should be STRING_DOC."""
         code = '"""This is a docstring"""'
         tokens = list(python_lexer.tokenize(code))
-        doc_tokens = [t for t in tokens if t.type == TokenType.STRING_DOC]
-        assert len(doc_tokens) > 0
+        assert any(t.type is TokenType.STRING_DOC for t in tokens)
 
 
 class TestPythonOperators:
@@ -166,16 +146,14 @@ class TestPythonOperators:
         operators = ["+", "-", "*", "/", "//", "%", "**"]
         for op in operators:
             tokens = list(python_lexer.tokenize(op))
-            op_tokens = [t for t in tokens if t.type == TokenType.OPERATOR]
-            assert len(op_tokens) > 0
+            assert any(t.type is TokenType.OPERATOR for t in tokens)
 
     def test_comparison_operators(self, python_lexer) -> None:
         """Comparison operators should be OPERATOR (except 'is' and 'in' which are keywords)."""
         operators = ["==", "!=", "<", ">", "<=", ">="]
         for op in operators:
             tokens = list(python_lexer.tokenize(op))
-            op_tokens = [t for t in tokens if t.type == TokenType.OPERATOR]
-            assert len(op_tokens) > 0
+            assert any(t.type is TokenType.OPERATOR for t in tokens)
 
         # 'is' and 'in' are keywords, not operators
         tokens = list(python_lexer.tokenize("is"))
@@ -191,17 +169,15 @@ class TestPythonDecorators:
         """Decorators should be NAME_DECORATOR."""
         code = "@decorator"
         tokens = list(python_lexer.tokenize(code))
-        decorator_tokens = [t for t in tokens if t.type == TokenType.NAME_DECORATOR]
-        assert len(decorator_tokens) > 0
+        assert any(t.type is TokenType.NAME_DECORATOR for t in tokens)
 
     def test_decorator_with_function(self, python_lexer) -> None:
         """Decorator before function should tokenize correctly."""
         code = "@decorator\ndef foo(): pass"
-        tokens = list(python_lexer.tokenize(code))
         # Should have decorator and function definition
-        types = [t.type for t in tokens]
-        assert TokenType.NAME_DECORATOR in types
-        assert TokenType.KEYWORD_DECLARATION in types
+        assert not missing_types(
+            python_lexer, code, {TokenType.NAME_DECORATOR, TokenType.KEYWORD_DECLARATION}
+        )
 
 
 class TestPythonTypeAnnotations:
@@ -210,12 +186,12 @@ class TestPythonTypeAnnotations:
     def test_type_hint(self, python_lexer) -> None:
         """Type hints should be tokenized."""
         code = "def foo(x: int) -> str:"
-        tokens = list(python_lexer.tokenize(code))
-        # Should have function, parameter, type hint
-        types = [t.type for t in tokens]
-        assert TokenType.KEYWORD_DECLARATION in types  # def
-        assert TokenType.NAME in types  # foo, x
-        assert TokenType.NAME_BUILTIN in types  # int, str
+        # Should have function (def), parameters (foo, x), type hints (int, str)
+        assert not missing_types(
+            python_lexer,
+            code,
+            {TokenType.KEYWORD_DECLARATION, TokenType.NAME, TokenType.NAME_BUILTIN},
+        )
 
 
 class TestPythonComplex:
@@ -224,35 +200,30 @@ class TestPythonComplex:
     def test_function_definition(self, python_lexer) -> None:
         """Function definition should tokenize correctly."""
         code = "def hello(name: str) -> str:\n    return f'Hello, {name}'"
-        tokens = list(python_lexer.tokenize(code))
-        # Should have keywords, names, strings
-        types = [t.type for t in tokens]
-        assert TokenType.KEYWORD_DECLARATION in types  # def
-        assert TokenType.NAME in types  # hello, name
-        assert TokenType.STRING in types  # f-string
+        # Should have keywords (def), names (hello, name), strings (f-string)
+        assert not missing_types(
+            python_lexer, code, {TokenType.KEYWORD_DECLARATION, TokenType.NAME, TokenType.STRING}
+        )
 
     def test_class_definition(self, python_lexer) -> None:
         """Class definition should tokenize correctly."""
         code = "class MyClass:\n    def __init__(self): pass"
-        tokens = list(python_lexer.tokenize(code))
-        types = [t.type for t in tokens]
-        assert TokenType.KEYWORD_DECLARATION in types  # class, def
-        assert TokenType.NAME in types  # MyClass, __init__, self
+        # class/def declarations plus names (MyClass, __init__, self)
+        assert not missing_types(
+            python_lexer, code, {TokenType.KEYWORD_DECLARATION, TokenType.NAME}
+        )
 
     def test_import_statement(self, python_lexer) -> None:
         """Import statements should tokenize correctly."""
         code = "from typing import List, Dict"
-        tokens = list(python_lexer.tokenize(code))
-        types = [t.type for t in tokens]
-        assert TokenType.KEYWORD_NAMESPACE in types  # from, import
+        # from/import are namespace keywords
+        assert not missing_types(python_lexer, code, {TokenType.KEYWORD_NAMESPACE})
 
     def test_list_comprehension(self, python_lexer) -> None:
         """List comprehensions should tokenize correctly."""
         code = "[x for x in range(10) if x % 2 == 0]"
-        tokens = list(python_lexer.tokenize(code))
-        types = [t.type for t in tokens]
-        assert TokenType.KEYWORD in types  # for, in, if
-        assert TokenType.OPERATOR in types  # %, ==
+        # keywords (for, in, if) and operators (%, ==)
+        assert not missing_types(python_lexer, code, {TokenType.KEYWORD, TokenType.OPERATOR})
 
 
 class TestPythonFixtures:
@@ -0,0 +1,110 @@
+"""Tests for the state-machine base module's public helpers.
+
+Covers the offset-based position API and the columnar token layout:
+- line_index / position_at round-trips against tokenize() output
+- TokenColumns iteration and token_at equivalence with Token streams
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from rosettes import Token, get_lexer
+from rosettes.lexers._state_machine import TokenColumns, line_index, position_at
+
+# Multiline snippet exercising tokens at line starts, mid-line, and
+# after blank lines.
+_SNIPPET = 'def foo(x):\n    y = "a\\nb"  # comment\n\n    return x + 1\n'
+
+
+class TestLineIndex:
+    """Test newline-offset collection."""
+
+    def test_empty_string(self) -> None:
+        """No newlines means an empty index."""
+        assert line_index("") == ()
+
+    def test_no_trailing_newline(self) -> None:
+        """Offsets match every '\\n' position exactly."""
+        code = "a\nbb\nccc"
+        assert line_index(code) == (1, 4)
+
+    def test_matches_str_positions(self) -> None:
+        """Index agrees with a naive per-character scan."""
+        expected = tuple(i for i, char in enumerate(_SNIPPET) if char == "\n")
+        assert line_index(_SNIPPET) == expected
+
+
+class TestPositionAt:
+    """Test offset -> (line, column) recovery."""
+
+    def test_first_character(self) -> None:
+        """Offset 0 is line 1, column 1."""
+        assert position_at(line_index(_SNIPPET), 0) == (1, 1)
+
+    def test_start_of_second_line(self) -> None:
+        """The character after a newline starts the next line."""
+        nl_offsets = line_index("ab\ncd")
+        assert position_at(nl_offsets, 3) == (2, 1)
+
+    def test_round_trips_token_positions(self) -> None:
+        """position_at recovers every token's (line, column) from its offset.
+
+        Offsets are reconstructed from the lossless-concatenation
+        invariant: each token starts where the previous one ended.
+        """
+        lexer = get_lexer("python")
+        nl_offsets = line_index(_SNIPPET)
+        offset = 0
+        for token in lexer.tokenize(_SNIPPET):
+            assert position_at(nl_offsets, offset) == (token.line, token.column), (
+                f"Position mismatch at offset {offset} for {token!r}"
+            )
+            offset += len(token.value)
+
+
+@pytest.fixture(scope="module")
+def columns() -> TokenColumns:
+    """Columnar tokenization of the shared snippet."""
+    return get_lexer("python").tokenize_soa(_SNIPPET)
+
+
+@pytest.fixture(scope="module")
+def tokens() -> list[Token]:
+    """Reference Token stream for the same snippet."""
+    return list(get_lexer("python").tokenize(_SNIPPET))
+
+
+class TestTokenColumns:
+    """Test the structure-of-arrays token layout."""
+
+    def test_len_matches_token_count(self, columns: TokenColumns, tokens: list[Token]) -> None:
+        """len() reports one entry per token."""
+        assert len(columns) == len(tokens)
+
+    def test_iteration_equals_tokenize(self, columns: TokenColumns, tokens: list[Token]) -> None:
+        """Iterating yields the exact Token stream tokenize() produces."""
+        assert list(columns) == tokens
+
+    def test_token_at_equals_tokenize(self, columns: TokenColumns, tokens: list[Token]) -> None:
+        """Random access materializes the same Token as iteration order."""
+        for i, expected in enumerate(tokens):
+            assert columns.token_at(i) == expected
+
+    def test_offsets_slice_token_values(self, columns: TokenColumns, tokens: list[Token]) -> None:
+        """(start, end) offsets slice each token's value out of the source."""
+        for i, token in enumerate(tokens):
+            assert columns.code[columns.starts[i] : columns.ends[i]] == token.value
+
+    def test_offsets_reconstruct_input(self, columns: TokenColumns) -> None:
+        """Concatenated slices reproduce the input, same as tokenize()."""
+        reconstructed = "".join(
+            [columns.code[s:e] for s, e in zip(columns.starts, columns.ends, strict=True)]
+        )
+        assert reconstructed == _SNIPPET
+
+    def test_empty_input(self) -> None:
+        """Empty source yields an empty columnar stream."""
+        columns = get_lexer("python").tokenize_soa("")
+        assert len(columns) == 0
+        assert list(columns) == []
@@ -14,7 +14,7 @@ class TestYamlBasics:
         lexer = get_lexer("yaml")
         code = "key: value"
         tokens = list(lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         # YAML keys are NAME_ATTRIBUTE, values are STRING
         assert TokenType.NAME_ATTRIBUTE in types or TokenType.NAME in types or TokenType.NAME_TAG in types
 
@@ -27,7 +27,7 @@ parent:
 """
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
-        reconstructed = "".join(t.value for t in tokens)
+        reconstructed = "".join([t.value for t in tokens])
         assert reconstructed == code
 
     def test_list_items(self) -> None:
@@ -52,7 +52,7 @@ description: |
   string value
 """
         tokens = list(lexer.tokenize(code))
-        reconstructed = "".join(t.value for t in tokens)
+        reconstructed = "".join([t.value for t in tokens])
         assert reconstructed == code
 
     def test_anchors_and_aliases(self) -> None:
@@ -73,7 +73,7 @@ production:
         lexer = get_lexer("yaml")
         code = "key: value  # this is a comment"
         tokens = list(lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.COMMENT_SINGLE in types
 
 
@@ -90,7 +90,7 @@ class TestYamlEdgeCases:
         lexer = get_lexer("yaml")
         code = 'quoted: "value with spaces"'
         tokens = list(lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.STRING in types or TokenType.STRING_DOUBLE in types
 
     def test_boolean_values(self) -> None:
@@ -111,7 +111,7 @@ float: 3.14
 negative: -10
 """
         tokens = list(lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.NUMBER in types or TokenType.NUMBER_INTEGER in types
 
     def test_null_values(self) -> None:
@@ -119,7 +119,7 @@ negative: -10
         code = "value: null"
         tokens = list(lexer.tokenize(code))
         assert len(tokens) > 0
-        reconstructed = "".join(t.value for t in tokens)
+        reconstructed = "".join([t.value for t in tokens])
         assert reconstructed == code
 
     def test_flow_sequence(self) -> None:
@@ -150,6 +150,6 @@ key: value
         lexer = get_lexer("yaml")
         code = "name: 'single quoted'"
         tokens = list(lexer.tokenize(code))
-        types = [t.type for t in tokens]
+        types = {t.type for t in tokens}
         assert TokenType.STRING in types or TokenType.STRING_SINGLE in types
 
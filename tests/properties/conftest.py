@@ -0,0 +1,18 @@
+"""Hypothesis settings profiles for the property suite.
+
+Select with HYPOTHESIS_PROFILE; the ci profile is the default. ci
+trades example count for wall time and disables the deadline, which
+otherwise triggers expensive shrinking runs whenever a cold machine
+brushes the limit. nightly digs deeper.
+"""
+
+from __future__ import annotations
+
+import os
+
+from hypothesis import settings
+
+settings.register_profile("ci", max_examples=25, deadline=None, derandomize=True)
+settings.register_profile("nightly", max_examples=200, deadline=2000)
+
+settings.load_profile(os.environ.get("HYPOTHESIS_PROFILE", "ci"))
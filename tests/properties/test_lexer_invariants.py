@@ -6,18 +6,35 @@ regardless of language. Uses hypothesis to generate diverse inputs.
 
 from __future__ import annotations
 
+import string
+
 import pytest
-from hypothesis import given, settings, strategies as st
+from hypothesis import given, strategies as st, target
 
 from rosettes import TokenType, get_lexer, list_languages
 
+# Registry scan done once at import; every parametrize below reuses it
+# instead of re-invoking list_languages() per decorator.
+_ALL_LANGUAGES = tuple(list_languages())
+
+# Property runs are embarrassingly parallel across languages. Group by
+# language (not one big group, which would pin everything to a single
+# worker) so 'pytest tests/properties -n auto --dist loadgroup' scales
+# with cores while each worker keeps its lexers warm.
+_LANGUAGE_PARAMS = tuple(
+    pytest.param(lang, marks=pytest.mark.xdist_group(name=lang)) for lang in _ALL_LANGUAGES
+)
+
+pytestmark = pytest.mark.property
 
-# Strategy: Generate plausible source code
+
+# Strategy: Generate plausible source code.
+# ASCII printables drive every interesting lexer branch (keywords,
+# operators, delimiters); a handful of non-ASCII codepoints keeps the
+# multibyte path covered without making Hypothesis sample and shrink
+# against the full Unicode L/N/P/S/Z categories.
 code_strategy = st.text(
-    alphabet=st.characters(
-        whitelist_categories=("L", "N", "P", "S", "Z"),
-        whitelist_characters="\n\t",
-    ),
+    alphabet=string.printable + "αβ漢🎉",
     min_size=0,
     max_size=1000,
 )
@@ -28,15 +45,13 @@ random_bytes_strategy = st.binary(min_size=0, max_size=500).map(
 )
 
 
-@pytest.mark.property
-@pytest.mark.parametrize("language", list_languages())
+@pytest.mark.parametrize("language", _LANGUAGE_PARAMS)
 @given(code=code_strategy)
-@settings(max_examples=50, deadline=1000)
 def test_token_concatenation_reconstructs_input(language: str, code: str) -> None:
     """Concatenating all token values must reproduce the original input."""
     lexer = get_lexer(language)
     tokens = list(lexer.tokenize(code))
-    reconstructed = "".join(t.value for t in tokens)
+    reconstructed = "".join([t.value for t in tokens])
     assert reconstructed == code, (
         f"Token concatenation mismatch for {language}:\n"
         f"Input:  {code!r}\n"
@@ -45,10 +60,8 @@ def test_token_concatenation_reconstructs_input(language: str, code: str) -> Non
     )
 
 
-@pytest.mark.property
-@pytest.mark.parametrize("language", list_languages())
+@pytest.mark.parametrize("language", _LANGUAGE_PARAMS)
 @given(code=code_strategy)
-@settings(max_examples=50, deadline=1000)
 def test_all_tokens_have_valid_positions(language: str, code: str) -> None:
     """All tokens must have line >= 1 and column >= 1."""
     lexer = get_lexer(language)
@@ -57,10 +70,8 @@ def test_all_tokens_have_valid_positions(language: str, code: str) -> None:
         assert token.column >= 1, f"Invalid column {token.column} for {token}"
 
 
-@pytest.mark.property
-@pytest.mark.parametrize("language", list_languages())
+@pytest.mark.parametrize("language", _LANGUAGE_PARAMS)
 @given(code=code_strategy)
-@settings(max_examples=50, deadline=1000)
 def test_no_empty_internal_tokens(language: str, code: str) -> None:
     """Internal tokens should not be empty."""
     lexer = get_lexer(language)
@@ -71,55 +82,63 @@ def test_no_empty_internal_tokens(language: str, code: str) -> None:
         assert len(token.value) > 0, f"Empty token at position {i} in {language}: {token}"
 
 
-# Subset of languages for random bytes stress test (55 total, test 10 for speed)
-RANDOM_BYTES_LANGUAGES = list_languages()[:10]
+# Subset of languages for random bytes stress test (55 total, test 10 for
+# speed). Hand-picked for lexer diversity — indent-sensitive, brace-heavy,
+# markup, and data formats — rather than the alphabetically-first ten,
+# which cluster on similar state machines.
+_RANDOM_BYTES_SUBSET = (
+    "python", "rust", "yaml", "json", "html", "c", "go", "javascript", "markdown", "bash",
+)
+RANDOM_BYTES_LANGUAGES = tuple(
+    pytest.param(lang, marks=pytest.mark.xdist_group(name=lang)) for lang in _RANDOM_BYTES_SUBSET
+)
 
 
-@pytest.mark.property
 @pytest.mark.parametrize("language", RANDOM_BYTES_LANGUAGES)
 @given(code=random_bytes_strategy)
-@settings(max_examples=20, deadline=2000)
 def test_lexer_handles_random_bytes(language: str, code: str) -> None:
     """Lexer should not crash on arbitrary UTF-8 input."""
     lexer = get_lexer(language)
     # Should complete without exception
     tokens = list(lexer.tokenize(code))
+    # Bias generation toward inputs that produce more tokens — garbage
+    # that mostly hits the whitespace branch teaches us little, so steer
+    # mutation into diverse lexer states.
+    target(float(len(tokens)), label="token_count")
     # Token concatenation should still work
-    reconstructed = "".join(t.value for t in tokens)
+    reconstructed = "".join([t.value for t in tokens])
     assert reconstructed == code
 
 
-@pytest.mark.property
-@pytest.mark.parametrize("language", list_languages())
+@pytest.mark.parametrize("language", _LANGUAGE_PARAMS)
 def test_empty_input_produces_valid_output(language: str) -> None:
     """Empty input should produce empty or whitespace-only tokens."""
     lexer = get_lexer(language)
     tokens = list(lexer.tokenize(""))
-    reconstructed = "".join(t.value for t in tokens)
+    reconstructed = "".join([t.value for t in tokens])
     assert reconstructed == ""
 
 
-@pytest.mark.property
-@pytest.mark.parametrize("language", list_languages())
+@pytest.mark.parametrize("language", _LANGUAGE_PARAMS)
 def test_single_newline_tokenizes(language: str) -> None:
     """Single newline should tokenize correctly."""
     lexer = get_lexer(language)
     tokens = list(lexer.tokenize("\n"))
-    reconstructed = "".join(t.value for t in tokens)
+    reconstructed = "".join([t.value for t in tokens])
     assert reconstructed == "\n"
 
 
 class TestTokenTypeConsistency:
     """Verify token types are used consistently."""
 
-    @pytest.mark.parametrize("language", list_languages())
+    @pytest.mark.parametrize("language", _LANGUAGE_PARAMS)
     def test_all_tokens_have_valid_type(self, language: str) -> None:
         """All tokens should have a valid TokenType."""
         lexer = get_lexer(language)
         code = "x = 1 + 2"  # Simple expression most languages handle
 
-        for token in lexer.tokenize(code):
-            assert isinstance(token.type, TokenType), (
-                f"Invalid token type {token.type} for {language}"
-            )
+        # Exact type compare: cheaper than isinstance's MRO walk, and
+        # one aggregated assert names every offender at once.
+        bad = [t for t in lexer.tokenize(code) if type(t.type) is not TokenType]
+        assert not bad, f"Invalid token types for {language}: {bad}"
 
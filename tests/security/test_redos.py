@@ -1,42 +1,68 @@
-"""ReDoS prevention tests — verify O(n) time guarantee with pathological inputs."""
+"""ReDoS prevention tests — verify O(n) time guarantee with pathological inputs.
+
+The slow pathological-input grid is skipped by default — opt in with
+--runredos. The per-language runs are independent pure-CPU work with
+no shared state, and per-language cost varies widely, so this suite
+benefits from pytest-xdist's work stealing:
+
+    pytest --runredos -m slow -n auto --dist worksteal
+
+Tests carry no xdist_group mark on purpose — any worker may take any
+(language, pattern) item.
+"""
 
 from __future__ import annotations
 
 import time
+import timeit
+from collections import deque
+from contextlib import suppress
 
 import pytest
 
 from rosettes import get_lexer, list_languages
 
+# One registry scan at import feeds the parametrization below.
+_ALL_LANGUAGES = tuple(list_languages())
+
+# Pathological patterns (language-agnostic), built once instead of per
+# parametrized language.
+_PATTERNS: tuple[str, ...] = (
+    '"' + '\\"' * 100 + "x",  # Repeated escapes
+    "(" * 50 + "x" + ")" * 50,  # Deep nesting
+    "/* " + "/* " * 20 + "x",  # Nested comments (if language supports)
+    "a" + "+a" * 100,  # Repeated operators
+)
+
+# Classic ReDoS probe for string lexers: repeated escapes in an f-string.
+_PATHOLOGICAL_FSTRING = 'f"' + '\\"' * 50 + "x"
+
+# Readable test IDs for the pattern axis.
+_PATTERN_IDS = ("escapes", "nesting", "comments", "operators")
+
 
 @pytest.mark.slow
-@pytest.mark.parametrize("language", list_languages())
-def test_lexer_no_redos(language: str) -> None:
+@pytest.mark.parametrize("language", _ALL_LANGUAGES)
+@pytest.mark.parametrize("pattern", _PATTERNS, ids=_PATTERN_IDS)
+def test_lexer_no_redos(language: str, pattern: str) -> None:
     """Lexer should complete in O(n) time for pathological input.
 
     All 54 lexers must pass this test to prevent ReDoS vulnerabilities.
     Uses 1s timeout to account for CI hardware variance.
-    """
-    from contextlib import suppress
 
+    The (language, pattern) grid is parametrized rather than looped so
+    a hang on one pattern doesn't mask the rest and xdist can steal
+    individual cells.
+    """
     lexer = get_lexer(language)
 
-    # Pathological patterns (language-agnostic)
-    patterns = [
-        '"' + '\\"' * 100 + "x",  # Repeated escapes
-        "(" * 50 + "x" + ")" * 50,  # Deep nesting
-        "/* " + "/* " * 20 + "x",  # Nested comments (if language supports)
-        "a" + "+a" * 100,  # Repeated operators
-    ]
-
-    for pattern in patterns:
-        start = time.perf_counter()
-        with suppress(Exception):  # Error is OK, hang is not
-            list(lexer.tokenize(pattern))
-        elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    with suppress(Exception):  # Error is OK, hang is not
+        deque(lexer.tokenize(pattern), maxlen=0)
+    elapsed = time.perf_counter() - start
 
-        # O(n) means linear time; generous 1s timeout for CI variance
-        assert elapsed < 1.0, f"{language}: {pattern[:50]}... took {elapsed:.3f}s"
+    # O(n) means linear time; generous 1s timeout for CI variance
+    assert elapsed < 1.0, f"{language}: {pattern[:50]}... took {elapsed:.3f}s"
 
 
 def test_lexer_linear_scaling() -> None:
@@ -46,16 +72,22 @@ def test_lexer_linear_scaling() -> None:
     small = "x = 1\n" * 1000  # 1K lines
     large = "x = 1\n" * 2000  # 2K lines
 
-    start = time.perf_counter()
-    list(lexer.tokenize(small))
-    small_time = time.perf_counter() - start
+    # Single samples are noise-bound (a scheduler hiccup in the small
+    # run produces a bogus ratio); take the min of several repeats,
+    # the standard statistic for microbenchmarks.
+    small_time = min(
+        timeit.Timer(lambda: deque(lexer.tokenize(small), maxlen=0)).repeat(repeat=5, number=1)
+    )
+    large_time = min(
+        timeit.Timer(lambda: deque(lexer.tokenize(large), maxlen=0)).repeat(repeat=5, number=1)
+    )
 
-    start = time.perf_counter()
-    list(lexer.tokenize(large))
-    large_time = time.perf_counter() - start
+    # Floor the denominator at 100µs so a near-timer-resolution small
+    # run can't inflate the ratio from ordinary jitter.
+    small_time = max(small_time, 1e-4)
 
     # Large should be ~2x small (with tolerance), not exponential
-    ratio = large_time / small_time if small_time > 0 else float("inf")
+    ratio = large_time / small_time
     assert ratio < 4.0, f"Scaling ratio {ratio:.2f}x suggests non-linear time"
 
 
@@ -64,11 +96,10 @@ def test_pathological_string_patterns(language: str) -> None:
     """Test known ReDoS patterns for string lexers."""
     lexer = get_lexer(language)
 
-    # Classic ReDoS: repeated escapes
-    pathological = 'f"' + '\\"' * 50 + "x"
+    pathological = _PATHOLOGICAL_FSTRING
 
     start = time.perf_counter()
-    list(lexer.tokenize(pathological))
+    deque(lexer.tokenize(pathological), maxlen=0)
     elapsed = time.perf_counter() - start
 
     # O(n) means ~linear scaling
@@ -86,7 +117,7 @@ def test_nested_comment_explosion(language: str) -> None:
         pathological = "/* " * 20 + "x"
 
         start = time.perf_counter()
-        list(lexer.tokenize(pathological))
+        deque(lexer.tokenize(pathological), maxlen=0)
         elapsed = time.perf_counter() - start
 
         assert elapsed < 0.1, f"{language}: Nested comments took {elapsed:.3f}s"
@@ -23,7 +23,7 @@ class TestConcurrentTokenization:
         for i, tokens in enumerate(results):
             assert len(tokens) > 0
             # Check that value is in tokens
-            all_values = "".join(t.value for t in tokens)
+            all_values = "".join([t.value for t in tokens])
             assert str(i) in all_values
 
     def test_concurrent_different_lexers(self) -> None:
@@ -83,7 +83,7 @@ class TestParallelAPICorrectness:
         assert len(results) == 50
         for i, tokens in enumerate(results):
             assert len(tokens) > 0
-            all_values = "".join(t.value for t in tokens)
+            all_values = "".join([t.value for t in tokens])
             assert str(i) in all_values
 
 
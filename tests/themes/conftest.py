@@ -0,0 +1,43 @@
+"""Shared fixtures for theme tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from rosettes.themes import get_palette, list_palettes
+
+# Palette discovery is deferred to pytest_generate_tests so filtered
+# runs that never collect these tests skip the registry walk. The
+# sentinel caches the one scan.
+_PALETTES: tuple[str, ...] | None = None
+
+
+def pytest_generate_tests(metafunc):
+    if "palette_name" in metafunc.fixturenames:
+        global _PALETTES
+        if _PALETTES is None:
+            _PALETTES = tuple(list_palettes())
+        metafunc.parametrize("palette_name", _PALETTES, scope="session")
+
+
+@pytest.fixture(scope="session")
+def css_cache():
+    """Generate each palette's CSS once for the whole session.
+
+    generate_css is deterministic (the suite asserts as much), so tests
+    that only inspect the output share one generation per
+    (palette_name, class_style) instead of regenerating per test.
+    """
+    cache: dict[tuple[str, str | None], str] = {}
+
+    def get(name: str, class_style: str | None = None) -> str:
+        key = (name, class_style)
+        if key not in cache:
+            palette = get_palette(name)
+            if class_style is None:
+                cache[key] = palette.generate_css()
+            else:
+                cache[key] = palette.generate_css(class_style=class_style)
+        return cache[key]
+
+    return get